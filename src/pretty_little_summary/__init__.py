@@ -7,13 +7,16 @@ Usage:
     # Get summary of any object
     result = pls.describe(my_dataframe)
 
+    # Several objects at once
+    results = pls.describe_many([df_a, df_b])
+
     print(result.content)  # Structured summary
     print(result.meta)     # Detailed metadata
     print(result.history)  # Code history (if in Jupyter)
 """
 
 from pretty_little_summary.adapters._base import list_available_adapters
-from pretty_little_summary.api import Description, describe
+from pretty_little_summary.api import Description, describe, describe_many
 
 __version__ = "0.1.0"
-__all__ = ["Description", "describe", "list_available_adapters"]
+__all__ = ["Description", "describe", "describe_many", "list_available_adapters"]
@@ -1,87 +1,159 @@
 """Adapter system for pretty_little_summary.
 
-Adapter modules are imported lazily via :func:`load_all_adapters`, which runs on
-the first ``describe()`` / ``list_available_adapters()`` call rather than at
-``import pretty_little_summary`` time. This keeps import instant and avoids
-pulling in heavy optional libraries until they are actually needed.
+Adapter modules are imported lazily rather than at ``import pretty_little_summary``
+time. ``describe()`` goes through :func:`load_adapters_for_loaded_libraries`,
+which imports an optional-library adapter only once the user's program has
+imported that library itself; ``list_available_adapters()`` uses
+:func:`load_all_adapters` to import everything that is installed. This keeps
+import instant and means describing a dict never pulls in pandas or matplotlib.
 """
 
+import sys
+
 from pretty_little_summary.adapters._base import (
     Adapter,
     AdapterRegistry,
     dispatch_adapter,
+    dispatch_many,
     list_available_adapters,
 )
 
-# Registration order among same-priority adapters still matters (it is the
-# tiebreaker), so this list is the source of truth for that order. Specialized
-# adapters come first; GenericAdapter registers itself at fallback priority.
-_ADAPTER_MODULES: tuple[str, ...] = (
-    "text_formats",
-    "primitives",
-    "pandas",
-    "polars",
-    "matplotlib",
-    "altair",
-    "seaborn_adapter",
-    "plotly_adapter",
-    "bokeh_adapter",
-    "sklearn_pipeline",
-    "sklearn",
-    "statsmodels_adapter",
-    "numpy_adapter",
-    "scipy_sparse_adapter",
-    "pyarrow_adapter",
-    "h5py_adapter",
-    "pil_adapter",
-    "pytorch",
-    "tensorflow_adapter",
-    "jax_adapter",
-    "xarray",
-    "pydantic",
-    "networkx",
-    "requests",
-    "datetime_adapter",
-    "pathlib_adapter",
-    "regex_adapter",
-    "uuid_adapter",
-    "io_adapter",
-    "attrs_adapter",
-    "ipython_display",
-    "structured",
-    "callables",
-    "async_adapter",
-    "errors",
+# Declared order of the built-in adapter modules, paired with the optional
+# library each one wraps (None for stdlib / duck-typed adapters). The order is
+# the tiebreaker among same-priority adapters, so it is the source of truth for
+# that order regardless of when a module is imported. Specialized adapters come
+# first; GenericAdapter registers itself at fallback priority.
+_ADAPTER_MODULES: tuple[tuple[str, str | None], ...] = (
+    ("text_formats", None),
+    ("primitives", None),
+    ("pandas", "pandas"),
+    ("polars", "polars"),
+    ("matplotlib", "matplotlib"),
+    ("altair", "altair"),
+    ("seaborn_adapter", "seaborn"),
+    ("plotly_adapter", "plotly"),
+    ("bokeh_adapter", "bokeh"),
+    ("sklearn_pipeline", None),
+    ("sklearn", None),
+    ("statsmodels_adapter", None),
+    ("numpy_adapter", "numpy"),
+    ("scipy_sparse_adapter", "scipy"),
+    ("pyarrow_adapter", "pyarrow"),
+    ("h5py_adapter", "h5py"),
+    ("pil_adapter", "PIL"),
+    ("pytorch", None),
+    ("tensorflow_adapter", None),
+    ("jax_adapter", None),
+    ("xarray", "xarray"),
+    ("pydantic", "pydantic"),
+    ("networkx", "networkx"),
+    ("requests", "requests"),
+    ("datetime_adapter", None),
+    ("pathlib_adapter", None),
+    ("regex_adapter", None),
+    ("uuid_adapter", None),
+    ("io_adapter", None),
+    ("attrs_adapter", "attr"),
+    ("ipython_display", "IPython"),
+    ("structured", None),
+    ("callables", None),
+    ("async_adapter", None),
+    ("errors", None),
     # Core collections come after specialized adapters so they don't shadow them.
-    "collections",
+    ("collections", None),
     # GenericAdapter (fallback) is imported last and self-registers lowest.
-    "generic",
+    ("generic", None),
+)
+
+# Library-backed adapters that duck-type objects whose classes never import
+# the library (IPythonDisplayAdapter accepts anything with a ``_repr_html_``
+# style hook). Their objects can exist before the library is imported, so they
+# load as soon as the library is installed rather than once it is imported.
+_DUCK_TYPED_MODULES = frozenset({"ipython_display"})
+
+AdapterRegistry.set_module_order(
+    f"pretty_little_summary.adapters.{name}" for name, _ in _ADAPTER_MODULES
 )
 
 _loaded = False
+# Library-backed modules not imported yet, as (module, library). None until the
+# stdlib/duck-typed adapters have been loaded.
+_pending: list[tuple[str, str]] | None = None
+# len(sys.modules) at the last pending check; unchanged means nothing new loaded.
+_modules_seen = -1
+
+
+def _import_adapter_module(name: str) -> None:
+    from importlib import import_module
+
+    try:
+        import_module(f"pretty_little_summary.adapters.{name}")
+    except ImportError:
+        # Optional dependency for this adapter is not installed — skip it.
+        pass
+
+
+def load_adapters_for_loaded_libraries() -> None:
+    """Import the adapters that can matter for objects that exist right now.
+
+    Adapters without a backing library are imported on the first call. An
+    adapter for an optional library is imported only once that library is in
+    ``sys.modules``: until the user's program imports it, no object of that
+    library can exist, so there is nothing for its adapter to handle. The
+    exception is ``_DUCK_TYPED_MODULES``, whose adapters recognise objects by
+    protocol; those are imported on the first call if the library is
+    installed. Registry
+    tiebreaks follow the declared module order, so a late import still lands
+    in the right place.
+    """
+    global _pending, _modules_seen
+    if _pending is None:
+        from importlib.util import find_spec
+
+        _pending = []
+        for name, library in _ADAPTER_MODULES:
+            if library is None:
+                _import_adapter_module(name)
+            elif name in _DUCK_TYPED_MODULES:
+                if find_spec(library) is not None:
+                    _import_adapter_module(name)
+            else:
+                _pending.append((name, library))
+
+    if not _pending or len(sys.modules) == _modules_seen:
+        return
+
+    remaining: list[tuple[str, str]] = []
+    for name, library in _pending:
+        if library in sys.modules:
+            _import_adapter_module(name)
+        else:
+            remaining.append((name, library))
+    _pending = remaining
+    _modules_seen = len(sys.modules)
 
 
 def load_all_adapters() -> None:
     """Import every built-in adapter module once (idempotent).
 
     Each module self-registers with :class:`AdapterRegistry` on import. Modules
-    whose backing library is unavailable raise ``ImportError`` and are skipped;
-    :meth:`AdapterRegistry.register` is idempotent, so calling this repeatedly is
-    safe.
+    whose backing library is not installed are skipped without importing them
+    (``find_spec`` only searches the path); any other ``ImportError`` also skips
+    the module. :meth:`AdapterRegistry.register` is idempotent, so calling this
+    repeatedly is safe.
     """
-    global _loaded
+    global _loaded, _pending
     if _loaded:
         return
 
-    from importlib import import_module
+    from importlib.util import find_spec
 
-    for name in _ADAPTER_MODULES:
-        try:
-            import_module(f"pretty_little_summary.adapters.{name}")
-        except ImportError:
-            # Optional dependency for this adapter is not installed — skip it.
+    for name, library in _ADAPTER_MODULES:
+        if library is not None and find_spec(library) is None:
             continue
+        _import_adapter_module(name)
 
+    _pending = []
     _loaded = True
 
 
@@ -89,6 +161,8 @@ __all__ = [
     "Adapter",
     "AdapterRegistry",
     "dispatch_adapter",
+    "dispatch_many",
     "list_available_adapters",
+    "load_adapters_for_loaded_libraries",
     "load_all_adapters",
 ]
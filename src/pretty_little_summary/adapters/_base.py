@@ -1,6 +1,8 @@
 """Base classes for the adapter system."""
 
 import sys
+import weakref
+from collections.abc import Iterable
 from typing import Any, ClassVar, Protocol
 
 from pretty_little_summary.core import MetaDescription
@@ -19,7 +21,16 @@ def module_loaded(name: str) -> bool:
 
 
 class Adapter(Protocol):
-    """Protocol for all adapters."""
+    """Protocol for all adapters.
+
+    Two optional class attributes tune dispatch (see :class:`AdapterRegistry`):
+
+    - ``handled_types``: tuple of classes the adapter can ever accept. Objects
+      of other types are rejected with one ``issubclass`` check, without calling
+      ``can_handle``.
+    - ``TYPE_DISPATCH = False``: ``can_handle`` looks at the value rather than
+      just the type, so its answer must not be cached per type.
+    """
 
     @staticmethod
     def can_handle(obj: Any) -> bool:
@@ -33,7 +44,7 @@ class Adapter(Protocol):
 
 
 # Priority tiers. Higher wins; adapters checked highest-first, ties broken by
-# registration order (so import order still decides among same-priority peers).
+# declared module order (see AdapterRegistry.set_module_order).
 PRIORITY_DEFAULT = 0
 PRIORITY_FALLBACK = -1000  # GenericAdapter — always last resort.
 
@@ -44,51 +55,133 @@ class AdapterRegistry:
 
     Design:
     - Explicit priority ordering (not import order): each adapter registers with
-      a priority; higher is checked first, ties broken by registration order.
-      This decouples "must be imported last" from "must be checked last".
+      a priority; higher is checked first. Ties are broken by the declared
+      position of the adapter's module (see ``set_module_order``), then by
+      registration order, so built-ins keep their relative order however and
+      whenever their modules get imported.
     - Idempotent registration: re-registering the same class is a no-op, so the
       module can be imported/reloaded without duplicating adapters.
     - Fallback: GenericAdapter for unknown types.
+    - Dispatch is memoized by ``type(obj)``. Most ``can_handle`` checks are pure
+      ``isinstance`` tests, so their answer for one instance holds for every
+      instance of the same type. Adapters whose answer depends on the value
+      (string content, list contents, per-instance attributes) set
+      ``TYPE_DISPATCH = False``; they are kept in the cached candidate list and
+      re-asked on every call, so caching never changes which adapter wins.
     """
 
-    # Each entry: (priority, sequence, adapter). `sequence` is a stable tiebreaker.
-    _entries: ClassVar[list[tuple[int, int, type[Adapter]]]] = []
+    # Each entry: (priority, (module rank, sequence), adapter). The second item
+    # is a stable tiebreaker.
+    _entries: ClassVar[list[tuple[int, tuple[int, int], type[Adapter]]]] = []
     _seq: int = 0
+    # Declared position of each built-in adapter module. Modules not listed
+    # (user adapters) rank after every built-in.
+    _module_order: ClassVar[dict[str, int]] = {}
+    # type(obj) -> adapters still worth asking, in priority order. Ends with the
+    # first type-based adapter that accepted the type (or GenericAdapter).
+    # Weakly keyed so dynamically created classes (per-call dataclasses,
+    # namedtuples, type() factories) are freed once nothing else uses them.
+    _type_cache: ClassVar[
+        "weakref.WeakKeyDictionary[type, tuple[type[Adapter], ...]]"
+    ] = weakref.WeakKeyDictionary()
+    # Adapter names in priority order, for list_available_adapters().
+    _cached_names: ClassVar[list[str] | None] = None
 
     @classmethod
     def register(cls, adapter: type[Adapter], priority: int = PRIORITY_DEFAULT) -> None:
         """Register an adapter at the given priority (idempotent by class)."""
         if any(existing is adapter for _, _, existing in cls._entries):
             return
-        cls._entries.append((priority, cls._seq, adapter))
+        rank = cls._module_order.get(adapter.__module__, len(cls._module_order))
+        cls._entries.append((priority, (rank, cls._seq), adapter))
         cls._seq += 1
         # Sort once at registration: highest priority first, then insertion order.
         cls._entries.sort(key=lambda e: (-e[0], e[1]))
+        cls._invalidate()
+
+    @classmethod
+    def set_module_order(cls, modules: Iterable[str]) -> None:
+        """Fix the tiebreak order of adapters by the module that defines them."""
+        cls._module_order = {name: rank for rank, name in enumerate(modules)}
+        for i, (priority, (_, seq), adapter) in enumerate(cls._entries):
+            rank = cls._module_order.get(adapter.__module__, len(cls._module_order))
+            cls._entries[i] = (priority, (rank, seq), adapter)
+        cls._entries.sort(key=lambda e: (-e[0], e[1]))
+        cls._invalidate()
 
     @classmethod
     def get_adapter(cls, obj: Any) -> type[Adapter]:
         """Find the highest-priority adapter that can handle obj."""
-        for _, _, adapter in cls._entries:
+        obj_type = type(obj)
+        candidates = cls._type_cache.get(obj_type)
+        if candidates is None:
+            candidates = cls._candidates_for(obj)
+            cls._type_cache[obj_type] = candidates
+        for adapter in candidates[:-1]:
             try:
                 if adapter.can_handle(obj):
                     return adapter
             except Exception:
                 # A misbehaving can_handle must never break dispatch.
                 continue
+        return candidates[-1]
+
+    @classmethod
+    def _candidates_for(cls, obj: Any) -> tuple[type[Adapter], ...]:
+        """Walk the registry once for type(obj), dropping type-based rejections.
+
+        Adapters declaring ``handled_types`` are filtered by an MRO check first.
+        Value-dependent adapters (``TYPE_DISPATCH = False``) and adapters whose
+        ``can_handle`` raised are kept so they get re-asked for every instance.
+        The walk stops at the first type-based adapter that accepts the object,
+        which is therefore the answer whenever no earlier candidate claims it.
+        """
+        obj_type = type(obj)
+        candidates: list[type[Adapter]] = []
+        for _, _, adapter in cls._entries:
+            handled = getattr(adapter, "handled_types", None)
+            if handled is not None and not issubclass(obj_type, handled):
+                continue
+            if not getattr(adapter, "TYPE_DISPATCH", True):
+                candidates.append(adapter)
+                continue
+            try:
+                accepted = adapter.can_handle(obj)
+            except Exception:
+                candidates.append(adapter)
+                continue
+            if accepted:
+                candidates.append(adapter)
+                return tuple(candidates)
         from pretty_little_summary.adapters.generic import GenericAdapter
 
-        return GenericAdapter
+        candidates.append(GenericAdapter)
+        return tuple(candidates)
 
     @classmethod
     def unregister(cls, adapter: type[Adapter]) -> None:
         """Remove an adapter if present (no-op otherwise)."""
         cls._entries = [e for e in cls._entries if e[2] is not adapter]
+        cls._invalidate()
 
     @classmethod
     def adapters(cls) -> list[type[Adapter]]:
         """Return registered adapter classes in priority order."""
         return [adapter for _, _, adapter in cls._entries]
 
+    @classmethod
+    def names(cls) -> list[str]:
+        """Return registered adapter names in priority order (cached)."""
+        if cls._cached_names is None:
+            cls._cached_names = [adapter.__name__ for _, _, adapter in cls._entries]
+        return list(cls._cached_names)
+
+    @classmethod
+    def _invalidate(cls) -> None:
+        """Drop everything derived from the registry contents or order."""
+        cls._type_cache.clear()
+        cls._cached_names = None
+
 
 def dispatch_adapter(obj: Any) -> MetaDescription:
     """
@@ -106,6 +199,30 @@ def dispatch_adapter(obj: Any) -> MetaDescription:
         MetaDescription with extracted metadata
     """
     _ensure_adapters_loaded()
+    return _dispatch_loaded(obj)
+
+
+def dispatch_many(objs: Iterable[Any]) -> list[MetaDescription]:
+    """
+    Dispatch several objects, in input order.
+
+    Equivalent to ``[dispatch_adapter(obj) for obj in objs]`` but checks for
+    newly importable adapters once for the whole batch instead of per object.
+    Objects of a type already seen reuse that type's cached candidate list.
+
+    Args:
+        objs: Objects to analyze
+
+    Returns:
+        One MetaDescription per object, with the same fallback behavior as
+        :func:`dispatch_adapter`
+    """
+    _ensure_adapters_loaded()
+    return [_dispatch_loaded(obj) for obj in objs]
+
+
+def _dispatch_loaded(obj: Any) -> MetaDescription:
+    """Pick an adapter for obj and extract, assuming adapters are loaded."""
     adapter = AdapterRegistry.get_adapter(obj)
     adapter_name = adapter.__name__
 
@@ -174,15 +291,14 @@ def _create_emergency_metadata(
 
 
 def _ensure_adapters_loaded() -> None:
-    """Import the built-in adapter modules on first use.
+    """Import the adapter modules relevant to objects that can exist right now.
 
-    Deferring these imports keeps ``import pretty_little_summary`` instant and,
-    for a zero-dependency install, means we never touch a heavy library until
-    the user actually asks us to describe something.
+    Deferring these imports keeps ``import pretty_little_summary`` instant and
+    means we never touch a heavy library the user has not imported themselves.
     """
-    from pretty_little_summary.adapters import load_all_adapters
+    from pretty_little_summary.adapters import load_adapters_for_loaded_libraries
 
-    load_all_adapters()
+    load_adapters_for_loaded_libraries()
 
 
 def list_available_adapters() -> list[str]:
@@ -197,5 +313,7 @@ def list_available_adapters() -> list[str]:
         >>> pls.list_available_adapters()
         ['PandasAdapter', 'MatplotlibAdapter', 'NumpyAdapter', 'GenericAdapter']
     """
-    _ensure_adapters_loaded()
-    return [adapter.__name__ for adapter in AdapterRegistry.adapters()]
+    from pretty_little_summary.adapters import load_all_adapters
+
+    load_all_adapters()
+    return AdapterRegistry.names()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import types
 from typing import Any
 
 from pretty_little_summary.adapters._base import AdapterRegistry
@@ -13,15 +14,12 @@ from pretty_little_summary.core import MetaDescription
 class AsyncAdapter:
     """Adapter for coroutine, Task, and Future objects."""
 
+    # asyncio.Task subclasses asyncio.Future, so two classes cover all three.
+    handled_types = (types.CoroutineType, asyncio.Future)
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
-        if inspect.iscoroutine(obj):
-            return True
-        if isinstance(obj, asyncio.Task):
-            return True
-        if isinstance(obj, asyncio.Future):
-            return True
-        return False
+        return inspect.iscoroutine(obj) or isinstance(obj, asyncio.Future)
 
     @staticmethod
     def extract_metadata(obj: Any) -> MetaDescription:
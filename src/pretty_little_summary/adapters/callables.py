@@ -53,12 +53,54 @@ def _describe_function(fn: Any) -> dict[str, Any]:
         "name": fn.__name__,
         "qualname": fn.__qualname__,
         "module": fn.__module__,
-        "signature": str(inspect.signature(fn)),
+        "signature": _function_signature(fn),
         "is_lambda": fn.__name__ == "<lambda>",
         "doc": _first_line(fn.__doc__),
     }
 
 
+_CO_VARARGS = inspect.CO_VARARGS
+_CO_VARKEYWORDS = inspect.CO_VARKEYWORDS
+
+
+def _function_signature(fn: types.FunctionType) -> str:
+    """str(inspect.signature(fn)), read straight off the code object when possible.
+
+    Plain functions without defaults, annotations, or signature overrides
+    (``__wrapped__``/``__signature__``) render the same from ``co_varnames``;
+    anything else goes through inspect.signature.
+    """
+    if (
+        fn.__defaults__
+        or fn.__kwdefaults__
+        or fn.__annotations__
+        or hasattr(fn, "__wrapped__")
+        or hasattr(fn, "__signature__")
+    ):
+        return str(inspect.signature(fn))
+
+    code = fn.__code__
+    names = code.co_varnames
+    n_posonly = code.co_posonlyargcount
+    n_positional = code.co_argcount
+    n_kwonly = code.co_kwonlyargcount
+    flags = code.co_flags
+
+    params = list(names[:n_positional])
+    if n_posonly:
+        params.insert(n_posonly, "/")
+    index = n_positional + n_kwonly
+    if flags & _CO_VARARGS:
+        params.append("*" + names[index])
+        index += 1
+    elif n_kwonly:
+        params.append("*")
+    params.extend(names[n_positional : n_positional + n_kwonly])
+    if flags & _CO_VARKEYWORDS:
+        params.append("**" + names[index])
+    return f"({', '.join(params)})"
+
+
 def _describe_method(method: Any) -> dict[str, Any]:
     return {
         "type": "method",
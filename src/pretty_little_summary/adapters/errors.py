@@ -45,21 +45,30 @@ def _describe_exception(exc: BaseException) -> dict[str, Any]:
 
 
 def _describe_traceback(traceback_obj: types.TracebackType) -> dict[str, Any]:
-    frames = []
-    for frame in tb.extract_tb(traceback_obj):
-        frames.append(
-            {
-                "filename": frame.filename,
-                "line": frame.lineno,
-                "name": frame.name,
-                "code": frame.line,
-            }
-        )
+    # lookup_lines=False defers the linecache read to FrameSummary.line, so
+    # source is only loaded for the frames we keep (first five and the last),
+    # not for every frame of a deep traceback.
+    summary = tb.StackSummary.extract(tb.walk_tb(traceback_obj), lookup_lines=False)
+    depth = len(summary)
+    frames = [_frame_dict(frame) for frame in summary[:5]]
+    if depth > 5:
+        last_frame = _frame_dict(summary[-1])
+    else:
+        last_frame = frames[-1] if frames else None
     return {
         "type": "traceback",
-        "depth": len(frames),
-        "frames": frames[:5],
-        "last_frame": frames[-1] if frames else None,
+        "depth": depth,
+        "frames": frames,
+        "last_frame": last_frame,
+    }
+
+
+def _frame_dict(frame: tb.FrameSummary) -> dict[str, Any]:
+    return {
+        "filename": frame.filename,
+        "line": frame.lineno,
+        "name": frame.name,
+        "code": frame.line,
     }
 
 
@@ -14,10 +14,15 @@ from pretty_little_summary.adapters._base import AdapterRegistry
 from pretty_little_summary.core import MetaDescription
 from pretty_little_summary.descriptor_utils import safe_repr
 
+# Attribute values are read from disk one by one; only this many are surfaced.
+_MAX_ATTRS = 32
+
 
 class H5pyAdapter:
     """Adapter for h5py.Dataset."""
 
+    handled_types = (h5py.Dataset,) if LIBRARY_AVAILABLE else ()
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if not LIBRARY_AVAILABLE:
@@ -47,7 +52,10 @@ class H5pyAdapter:
 
 
 def _describe_dataset(dataset: h5py.Dataset) -> dict[str, Any]:
-    attrs = {k: safe_repr(v, 100) for k, v in dataset.attrs.items()}
+    attr_keys = list(dataset.attrs.keys())
+    attrs = {k: safe_repr(dataset.attrs[k], 100) for k in attr_keys[:_MAX_ATTRS]}
+    if len(attr_keys) > _MAX_ATTRS:
+        attrs["..."] = f"+{len(attr_keys) - _MAX_ATTRS} more"
     sample = None
     try:
         if dataset.shape and dataset.shape[0] > 0:
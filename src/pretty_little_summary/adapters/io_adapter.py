@@ -13,6 +13,9 @@ from pretty_little_summary.descriptor_utils import format_bytes
 class IOAdapter:
     """Adapter for IO-related objects."""
 
+    # Duck-typed on instance attributes.
+    TYPE_DISPATCH = False
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if isinstance(obj, (io.BytesIO, io.StringIO)):
@@ -2,30 +2,37 @@
 
 from __future__ import annotations
 
+import sys
+from importlib.util import find_spec
 from typing import Any
 
-try:
-    from IPython.display import DisplayObject
-    LIBRARY_AVAILABLE = True
-except ImportError:
-    LIBRARY_AVAILABLE = False
-
 from pretty_little_summary.adapters._base import AdapterRegistry
 from pretty_little_summary.core import MetaDescription
 
+# IPython is not imported here: rich-repr objects are recognised by their
+# ``_repr_*_`` hooks alone, and a DisplayObject can only exist once the user
+# has imported IPython.display, so importing it ourselves would only slow down
+# every describe() of an ordinary object.
+LIBRARY_AVAILABLE = find_spec("IPython") is not None
+
 
 class IPythonDisplayAdapter:
     """Adapter for IPython display objects and rich reprs."""
 
+    # ``_repr_*_`` hooks may be set per instance.
+    TYPE_DISPATCH = False
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if not LIBRARY_AVAILABLE:
             return False
-        try:
-            if isinstance(obj, DisplayObject):
-                return True
-        except Exception:
-            return False
+        display = sys.modules.get("IPython.display")
+        if display is not None:
+            try:
+                if isinstance(obj, display.DisplayObject):
+                    return True
+            except Exception:
+                return False
         return _has_rich_repr(obj)
 
     @staticmethod
@@ -12,12 +12,15 @@ except ImportError:
 
 from pretty_little_summary.adapters._base import AdapterRegistry
 from pretty_little_summary.core import MetaDescription
+from pretty_little_summary.descriptor_registry import DescribeConfigRegistry
 from pretty_little_summary.descriptor_utils import compute_numeric_stats, format_bytes, safe_repr
 
 
 class NumpyAdapter:
     """Adapter for numpy.ndarray and numpy scalar types."""
 
+    handled_types = (np.ndarray, np.generic) if LIBRARY_AVAILABLE else ()
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if not LIBRARY_AVAILABLE:
@@ -29,19 +32,16 @@ class NumpyAdapter:
 
     @staticmethod
     def extract_metadata(obj: Any) -> MetaDescription:
-        from pretty_little_summary.descriptor_registry import DescribeConfigRegistry
-
         config = DescribeConfigRegistry.get()
+        is_array = isinstance(obj, np.ndarray)
         meta: MetaDescription = {
-            "object_type": "numpy.ndarray" if hasattr(obj, "shape") else "numpy.scalar",
+            "object_type": "numpy.ndarray" if is_array else "numpy.scalar",
             "adapter_used": "NumpyAdapter",
         }
         metadata: dict[str, Any] = {}
 
         try:
-            import numpy as np
-
-            if isinstance(obj, np.ndarray):
+            if is_array:
                 metadata.update(_describe_ndarray(obj, config))
                 meta["shape"] = obj.shape
             else:
@@ -77,7 +77,8 @@ def _describe_ndarray(arr: np.ndarray, config) -> dict[str, Any]:
         metadata["shape"] = tuple(int(x) for x in arr.shape)
 
     if _is_numeric_dtype(arr.dtype):
-        stats = compute_numeric_stats(_sample_numeric_array(arr, 10000))
+        sample = _sample_numeric_array(arr, 10000, config.numeric_sample_strategy)
+        stats = compute_numeric_stats(sample)
         if stats:
             metadata["stats"] = stats.to_prose()
 
@@ -93,17 +94,29 @@ def _describe_scalar(value: np.generic) -> dict[str, Any]:
     }
 
 
-def _sample_numeric_array(arr: np.ndarray, limit: int) -> list[float | int]:
+def _sample_numeric_array(arr: np.ndarray, limit: int, strategy: str = "stride") -> np.ndarray:
+    """Pick at most ``limit`` elements for stats.
+
+    "stride" takes every k-th element so the sample spans the whole array (a
+    prefix misrepresents sorted or block-structured data) while reads stay
+    sequential; "random" draws a seeded uniform subsample; "head" is the prefix.
+    """
     flat = arr.ravel()
-    if flat.size > limit:
-        sample = flat[:limit]
-    else:
-        sample = flat
-    return [float(v) if hasattr(v, "__float__") else int(v) for v in sample.tolist()]
+    if flat.size <= limit:
+        return flat
+    if strategy == "head":
+        return flat[:limit]
+    if strategy == "random":
+        idx = np.random.default_rng(0).choice(flat.size, limit, replace=False)
+        return flat[np.sort(idx)]
+    return flat[:: flat.size // limit][:limit]
+
+
+_NUMERIC_KINDS = frozenset("iuf")
 
 
 def _is_numeric_dtype(dtype: np.dtype) -> bool:
-    return dtype.kind in {"i", "u", "f"}
+    return dtype.kind in _NUMERIC_KINDS
 
 
 if LIBRARY_AVAILABLE:
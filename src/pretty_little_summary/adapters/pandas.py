@@ -1,10 +1,23 @@
 """Pandas adapter."""
 
+import sys
+import threading
+from importlib.util import find_spec
+from itertools import islice
 from typing import Any
 
 try:
+    import numpy as np
     import pandas as pd
     LIBRARY_AVAILABLE = True
+    _PD_TYPES = (
+        pd.DataFrame,
+        pd.Series,
+        pd.Index,
+        pd.MultiIndex,
+        pd.Timestamp,
+        pd.Categorical,
+    )
 except ImportError:
     LIBRARY_AVAILABLE = False
 
@@ -16,105 +29,121 @@ from pretty_little_summary.descriptor_utils import (
     compute_numeric_stats,
     format_bytes,
     safe_repr,
+    safe_repr_many,
 )
 
+# DataFrame.to_markdown needs tabulate; decide once instead of raising per call.
+_TABULATE_AVAILABLE = find_spec("tabulate") is not None
+
+# Per-thread seeded generator for sampling; see _seeded_rng.
+_rng_local = threading.local()
+
+# Widest slice of a DataFrame that gets per-column analysis or sample rendering.
+_MAX_COLUMNS = 25
+
 
 class PandasAdapter:
     """Adapter for pandas DataFrame/Series."""
 
+    handled_types = _PD_TYPES if LIBRARY_AVAILABLE else ()
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if not LIBRARY_AVAILABLE:
             return False
-        try:
-            return isinstance(
-                obj,
-                (
-                    pd.DataFrame,
-                    pd.Series,
-                    pd.Index,
-                    pd.MultiIndex,
-                    pd.Timestamp,
-                    pd.Categorical,
-                ),
-            )
-        except Exception:
-            return False
+        return isinstance(obj, _PD_TYPES)
 
     @staticmethod
     def extract_metadata(obj: Any) -> MetaDescription:
+        return _extract_metadata(obj, DescribeConfigRegistry.get())
+
+
+def _extract_metadata(obj: Any, config) -> MetaDescription:
+    try:
+        meta: MetaDescription = {
+            "object_type": f"pandas.{type(obj).__name__}",
+            "adapter_used": "PandasAdapter",
+            "warnings": [],
+        }
+        metadata: dict[str, Any] = {}
+
+        # Shape
         try:
-            import pandas as pd
+            meta["shape"] = obj.shape
+        except Exception as e:
+            meta["warnings"].append(f"Could not get shape: {e}")
 
-            config = DescribeConfigRegistry.get()
-            meta: MetaDescription = {
-                "object_type": f"pandas.{type(obj).__name__}",
-                "adapter_used": "PandasAdapter",
-            }
-            metadata: dict[str, Any] = {}
+        # Columns (DataFrame only)
+        if isinstance(obj, pd.DataFrame):
+            try:
+                meta["columns"] = obj.columns.tolist()
+            except Exception as e:
+                meta["warnings"].append(f"Could not get columns: {e}")
 
-            # Shape
+            # Dtypes
             try:
-                meta["shape"] = obj.shape
+                meta["dtypes"] = _dtype_strings(obj.dtypes)
             except Exception as e:
-                meta.setdefault("warnings", []).append(f"Could not get shape: {e}")
-
-            # Columns (DataFrame only)
-            if isinstance(obj, pd.DataFrame):
-                try:
-                    meta["columns"] = obj.columns.tolist()
-                except Exception as e:
-                    meta.setdefault("warnings", []).append(f"Could not get columns: {e}")
-
-                # Dtypes
-                try:
-                    meta["dtypes"] = {col: str(dtype) for col, dtype in obj.dtypes.items()}
-                except Exception as e:
-                    meta.setdefault("warnings", []).append(f"Could not get dtypes: {e}")
-
-                # Sample data (first 3 rows as markdown)
-                try:
-                    meta["sample_data"] = obj.head(3).to_markdown()
-                except Exception:
-                    # to_markdown might not be available
-                    try:
-                        meta["sample_data"] = obj.head(3).to_string()
-                    except Exception as e:
-                        meta.setdefault("warnings", []).append(
-                            f"Could not get sample data: {e}"
-                        )
-                metadata.update(_describe_dataframe(obj, config))
-            elif isinstance(obj, pd.Series):
-                # Series
-                try:
-                    meta["dtypes"] = {"dtype": str(obj.dtype)}
-                except Exception as e:
-                    meta.setdefault("warnings", []).append(f"Could not get dtype: {e}")
-                metadata.update(_describe_series(obj, config))
-            elif isinstance(obj, pd.MultiIndex):
-                metadata.update(_describe_multiindex(obj, config))
-            elif isinstance(obj, pd.Index):
-                metadata.update(_describe_index(obj, config))
-            elif isinstance(obj, pd.Timestamp):
-                metadata.update(_describe_timestamp(obj))
-            elif isinstance(obj, pd.Categorical):
-                metadata.update(_describe_categorical(obj))
-
-            if metadata:
-                meta["metadata"] = metadata
-                meta["nl_summary"] = _build_nl_summary(meta, metadata)
-
-            return meta
+                meta["warnings"].append(f"Could not get dtypes: {e}")
 
-        except Exception as e:
-            # Fallback to generic if adapter completely fails
-            return {
-                "object_type": f"{type(obj).__module__}.{type(obj).__name__}",
-                "adapter_used": "PandasAdapter (failed)",
-                "warnings": [f"Adapter failed: {e}"],
-                "raw_repr": repr(obj)[:500],
-            }
+            metadata.update(_describe_dataframe(obj, config))
 
+            # Sample data (first 3 rows, capped columns; a table string only
+            # when asked for)
+            try:
+                sample_rows = metadata.get("sample_rows")
+                if config.sample_format == "markdown":
+                    head = obj.iloc[:3, :_MAX_COLUMNS]
+                    table = head.to_markdown() if _TABULATE_AVAILABLE else head.to_string()
+                    hidden = obj.shape[1] - head.shape[1]
+                    if hidden > 0:
+                        table += f" ... ({hidden} more columns)"
+                    meta["sample_data"] = table
+                elif sample_rows is not None and config.sample_size >= 3:
+                    # Same records _describe_dataframe already formatted; trim
+                    # instead of converting the head again.
+                    meta["sample_data"] = [
+                        dict(islice(row.items(), _MAX_COLUMNS)) for row in sample_rows[:3]
+                    ]
+                else:
+                    head = obj.iloc[:3, :_MAX_COLUMNS]
+                    meta["sample_data"] = _format_sample_rows(
+                        head.to_dict(orient="records"), config
+                    )
+            except Exception as e:
+                meta["warnings"].append(f"Could not get sample data: {e}")
+        elif isinstance(obj, pd.Series):
+            # Series
+            try:
+                meta["dtypes"] = {"dtype": str(obj.dtype)}
+            except Exception as e:
+                meta["warnings"].append(f"Could not get dtype: {e}")
+            metadata.update(_describe_series(obj, config))
+        elif isinstance(obj, pd.MultiIndex):
+            metadata.update(_describe_multiindex(obj, config))
+        elif isinstance(obj, pd.Index):
+            metadata.update(_describe_index(obj, config))
+        elif isinstance(obj, pd.Timestamp):
+            metadata.update(_describe_timestamp(obj))
+        elif isinstance(obj, pd.Categorical):
+            metadata.update(_describe_categorical(obj))
+
+        if metadata:
+            meta["metadata"] = metadata
+            meta["nl_summary"] = _build_nl_summary(meta, metadata)
+
+        if not meta["warnings"]:
+            del meta["warnings"]
+        return meta
+
+    except Exception as e:
+        # Fallback to generic if adapter completely fails
+        return {
+            "object_type": f"{type(obj).__module__}.{type(obj).__name__}",
+            "adapter_used": "PandasAdapter (failed)",
+            "warnings": [f"Adapter failed: {e}"],
+            "raw_repr": repr(obj)[:500],
+        }
 
 
 # Auto-register if library is available
@@ -132,40 +161,11 @@ def _describe_series(series: "pd.Series", config) -> dict[str, Any]:
 
     try:
         metadata["index_type"] = type(series.index).__name__
-        metadata["index_sample"] = [safe_repr(v, 50) for v in series.index[: config.sample_size]]
-    except Exception:
-        pass
-
-    try:
-        nulls = int(series.isna().sum())
-        metadata["null_count"] = nulls
+        metadata["index_sample"] = safe_repr_many(series.index[: config.sample_size], 50)
     except Exception:
         pass
 
-    try:
-        sample = series.head(config.sample_size).tolist()
-        metadata["sample_values"] = [safe_repr(v, config.max_sample_repr) for v in sample]
-    except Exception:
-        pass
-
-    if _is_numeric(series):
-        try:
-            samples = _sample_series_values(series, 10000)
-            stats = compute_numeric_stats(samples)
-            if stats:
-                metadata["stats"] = stats.to_prose()
-                metadata["stats_sample_size"] = len(samples)
-        except Exception:
-            pass
-    else:
-        try:
-            samples = _sample_series_values(series, 10000)
-            cardinality = compute_cardinality(samples)
-            metadata["cardinality"] = cardinality.to_prose()
-            metadata["cardinality_sample_size"] = len(samples)
-        except Exception:
-            pass
-
+    metadata.update(_column_profile(series, config))
     return metadata
 
 
@@ -178,24 +178,24 @@ def _describe_dataframe(df: "pd.DataFrame", config) -> dict[str, Any]:
 
     try:
         metadata["index_type"] = type(df.index).__name__
-        metadata["index_sample"] = [safe_repr(v, 50) for v in df.index[: config.sample_size]]
+        metadata["index_sample"] = safe_repr_many(df.index[: config.sample_size], 50)
     except Exception:
         pass
 
+    null_counts: list[int] | None = None
     try:
-        nulls = int(df.isna().sum().sum())
-        metadata["null_count"] = nulls
+        null_counts = _column_null_counts(df)
+        metadata["null_count"] = sum(null_counts)
     except Exception:
         pass
 
     try:
-        memory = int(df.memory_usage(deep=True).sum())
-        metadata["memory_bytes"] = memory
+        metadata["memory_bytes"] = _estimate_memory_bytes(df)
     except Exception:
         pass
 
     try:
-        metadata["column_analysis"] = _analyze_columns(df, config)
+        metadata["column_analysis"] = _analyze_columns(df, config, null_counts)
     except Exception:
         pass
 
@@ -213,6 +213,78 @@ def _describe_dataframe(df: "pd.DataFrame", config) -> dict[str, Any]:
     return metadata
 
 
+def _seeded_rng() -> "np.random.Generator":
+    """A generator in its seed-0 state, reused per thread instead of rebuilt.
+
+    Rewinding a cached generator is several times cheaper than constructing
+    ``default_rng(0)`` for every column, and draws stay identical per call.
+    """
+    rng = getattr(_rng_local, "rng", None)
+    if rng is None:
+        rng = _rng_local.rng = np.random.default_rng(0)
+        _rng_local.state = rng.bit_generator.state
+    else:
+        rng.bit_generator.state = _rng_local.state
+    return rng
+
+
+def _dtype_strings(dtypes: "pd.Series") -> dict[Any, str]:
+    """Column -> dtype name, formatting each distinct dtype only once.
+
+    Wide frames repeat a handful of dtypes; ``str(dtype)`` is the costly part.
+    """
+    names: dict[Any, str] = {}
+    out: dict[Any, str] = {}
+    for col, dtype in zip(dtypes.index.tolist(), dtypes.tolist()):
+        name = names.get(dtype)
+        if name is None:
+            name = names[dtype] = str(dtype)
+        out[col] = name
+    return out
+
+
+def _estimate_memory_bytes(df: "pd.DataFrame", sample_rows: int = 1024) -> int:
+    """``memory_usage(deep=True)`` total, estimated for large object columns.
+
+    Deep usage calls ``sys.getsizeof`` on every Python object in object (and
+    python-backed string) columns. Beyond ``sample_rows`` rows those columns are estimated from a
+    seeded sample of that many values scaled to the column length; an
+    order-of-magnitude figure is all a summary needs. Small frames stay exact.
+    """
+    rows = int(df.shape[0])
+    if rows <= sample_rows:
+        return int(df.memory_usage(deep=True).sum())
+
+    total = int(df.memory_usage(index=False, deep=False).sum())
+    positions = _seeded_rng().integers(0, rows, sample_rows)
+    for i, dtype in enumerate(df.dtypes):
+        if not _holds_python_objects(dtype):
+            continue
+        sampled = df.iloc[positions, i].tolist()
+        average = sum(sys.getsizeof(v) for v in sampled) / sample_rows
+        total += int(average * rows)
+
+    # The index gets the same treatment: a flat object/string index is
+    # sampled like a column; anything else (RangeIndex, numeric, MultiIndex,
+    # whose levels hold only unique values) is measured exactly.
+    index = df.index
+    if not isinstance(index, pd.MultiIndex) and _holds_python_objects(index.dtype):
+        total += int(index.memory_usage(deep=False))
+        sampled = index[positions].tolist()
+        average = sum(sys.getsizeof(v) for v in sampled) / sample_rows
+        total += int(average * rows)
+    else:
+        total += int(index.memory_usage(deep=True))
+    return total
+
+
+def _holds_python_objects(dtype: Any) -> bool:
+    """Columns stored as Python objects (object dtype, python-backed strings)."""
+    if pd.api.types.is_object_dtype(dtype):
+        return True
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "python"
+
+
 def _format_sample_rows(rows: list[dict[str, Any]], config) -> list[dict[str, Any]]:
     formatted: list[dict[str, Any]] = []
     for row in rows:
@@ -222,45 +294,41 @@ def _format_sample_rows(rows: list[dict[str, Any]], config) -> list[dict[str, An
     return formatted
 
 
-def _analyze_columns(df: "pd.DataFrame", config) -> list[dict[str, Any]]:
+def _analyze_columns(
+    df: "pd.DataFrame", config, null_counts: list[int] | None = None
+) -> list[dict[str, Any]]:
+    """Profile the first ``_MAX_COLUMNS`` columns.
+
+    ``null_counts`` (from :func:`_column_null_counts`) lets columns without
+    nulls skip their own NA scan.
+    """
     analysis: list[dict[str, Any]] = []
-    for col in list(df.columns)[: min(len(df.columns), 25)]:
-        series = df[col]
+    for i, col in enumerate(df.columns[:_MAX_COLUMNS]):
+        series = df.iloc[:, i]
         col_meta: dict[str, Any] = {
             "name": str(col),
             "dtype": str(series.dtype),
         }
-        try:
-            col_meta["null_count"] = int(series.isna().sum())
-        except Exception:
-            pass
+        null_count = null_counts[i] if null_counts is not None else None
+        col_meta.update(_column_profile(series, config, null_count=null_count))
+        analysis.append(col_meta)
+    return analysis
 
-        try:
-            sample = series.head(config.sample_size).tolist()
-            col_meta["sample_values"] = [safe_repr(v, config.max_sample_repr) for v in sample]
-        except Exception:
-            pass
 
-        if _is_numeric(series):
-            try:
-                samples = _sample_series_values(series, 10000)
-                stats = compute_numeric_stats(samples)
-                if stats:
-                    col_meta["stats"] = stats.to_prose()
-                    col_meta["stats_sample_size"] = len(samples)
-            except Exception:
-                pass
-        else:
-            try:
-                samples = _sample_series_values(series, 10000)
-                cardinality = compute_cardinality(samples)
-                col_meta["cardinality"] = cardinality.to_prose()
-                col_meta["cardinality_sample_size"] = len(samples)
-            except Exception:
-                pass
+def _cannot_hold_na(dtype: Any) -> bool:
+    """Plain NumPy int/uint/bool columns have no missing-value representation."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "iub"
 
-        analysis.append(col_meta)
-    return analysis
+
+def _column_null_counts(df: "pd.DataFrame") -> list[int]:
+    """Per-column null counts, scanning only columns whose dtype can hold NA."""
+    counts = [0] * df.shape[1]
+    maybe_na = [i for i, dtype in enumerate(df.dtypes) if not _cannot_hold_na(dtype)]
+    if maybe_na:
+        per_column = df.iloc[:, maybe_na].isna().to_numpy().sum(axis=0)
+        for i, count in zip(maybe_na, per_column):
+            counts[i] = int(count)
+    return counts
 
 
 def _is_numeric(series: "pd.Series") -> bool:
@@ -270,21 +338,69 @@ def _is_numeric(series: "pd.Series") -> bool:
         return False
 
 
-def _sample_series_values(series: "pd.Series", limit: int) -> list[Any]:
+def _column_profile(
+    series: "pd.Series", config, limit: int = 10000, null_count: int | None = None
+) -> dict[str, Any]:
+    """Null count, head sample and stats/cardinality from one NA-mask pass.
+
+    The stats sample is a seeded uniform draw of at most ``limit`` non-null
+    values: a float64 ndarray for numeric columns (vectorized stats path), the
+    series' own values otherwise (so Timestamps etc. keep their type). A known
+    ``null_count`` of zero skips the NA scan altogether.
+    """
+    profile: dict[str, Any] = {}
+    numeric = _is_numeric(series)
+    n_rows = int(series.shape[0])
+    try:
+        values = series.to_numpy(dtype="float64", na_value=np.nan) if numeric else None
+        if null_count == 0:
+            mask = slice(None)
+            n_valid = n_rows
+        else:
+            mask = ~np.isnan(values) if numeric else series.notna().to_numpy()
+            n_valid = int(np.count_nonzero(mask))
+        profile["null_count"] = n_rows - n_valid
+    except Exception:
+        mask = None
+
     try:
-        cleaned = series.dropna()
+        profile["sample_values"] = safe_repr_many(
+            series.iloc[: config.sample_size], config.max_sample_repr
+        )
     except Exception:
-        cleaned = series
+        pass
+
+    if mask is None:
+        return profile
+    # Select rows without building a filtered copy of the column: positions
+    # into the valid rows when subsampling, the mask itself when there are
+    # nulls, and a no-copy full slice when there are none.
+    has_nulls = n_valid < n_rows
+    if n_valid > limit:
+        valid = np.sort(_seeded_rng().choice(n_valid, limit, replace=False))
+        if has_nulls:
+            valid = np.flatnonzero(mask)[valid]
+    elif has_nulls:
+        valid = mask
+    else:
+        valid = slice(None)
+
     try:
-        length = len(cleaned)
-        if length > limit:
-            return cleaned.sample(n=limit, random_state=0).tolist()
-        return cleaned.tolist()
+        if numeric:
+            samples = values[valid]
+            stats = compute_numeric_stats(samples)
+            if stats:
+                profile["stats"] = stats.to_prose()
+                profile["stats_sample_size"] = len(samples)
+        else:
+            samples = series.iloc[valid].tolist()
+            cardinality = compute_cardinality(samples)
+            profile["cardinality"] = cardinality.to_prose()
+            profile["cardinality_sample_size"] = len(samples)
     except Exception:
-        try:
-            return cleaned.head(limit).tolist()
-        except Exception:
-            return []
+        pass
+
+    return profile
 
 
 def _describe_index(index: "pd.Index", config) -> dict[str, Any]:
@@ -296,7 +412,7 @@ def _describe_index(index: "pd.Index", config) -> dict[str, Any]:
         "is_unique": bool(index.is_unique),
     }
     try:
-        metadata["sample_values"] = [safe_repr(v, 50) for v in index[: config.sample_size]]
+        metadata["sample_values"] = safe_repr_many(index[: config.sample_size], 50)
     except Exception:
         pass
     return metadata
@@ -310,7 +426,7 @@ def _describe_multiindex(index: "pd.MultiIndex", config) -> dict[str, Any]:
         "names": list(index.names),
     }
     try:
-        metadata["sample_values"] = [safe_repr(v, 50) for v in index[: config.sample_size]]
+        metadata["sample_values"] = safe_repr_many(index[: config.sample_size], 50)
     except Exception:
         pass
     return metadata
@@ -326,17 +442,36 @@ def _describe_timestamp(value: "pd.Timestamp") -> dict[str, Any]:
 
 
 def _describe_categorical(cat: "pd.Categorical") -> dict[str, Any]:
-    categories = list(cat.categories)
-    counts = cat.value_counts().head(5).to_dict() if hasattr(cat, "value_counts") else None
+    try:
+        counts = _top_category_counts(cat, 5)
+    except Exception:
+        counts = None
     return {
         "type": "categorical",
         "length": len(cat),
-        "categories": [safe_repr(v, 50) for v in categories[:10]],
+        "categories": safe_repr_many(cat.categories[:10], 50),
         "ordered": bool(cat.ordered),
         "counts": counts,
     }
 
 
+def _top_category_counts(cat: "pd.Categorical", k: int) -> dict[Any, int]:
+    """The k most frequent categories (ties in category order), via the codes."""
+    codes = np.asarray(cat.codes)
+    counts = np.bincount(codes[codes >= 0], minlength=len(cat.categories))
+    if counts.size > k:
+        # Keep every category tied with the k-th largest count so the final
+        # order does not depend on how argpartition breaks ties.
+        kth = np.partition(counts, counts.size - k)[counts.size - k]
+        candidates = np.flatnonzero(counts >= kth)
+    else:
+        candidates = np.arange(counts.size)
+    top = candidates[np.lexsort((candidates, -counts[candidates]))][:k]
+    # tolist() yields Python scalars (as value_counts().to_dict() did), so the
+    # metadata stays JSON-serializable for integer categories.
+    return dict(zip(cat.categories[top].tolist(), counts[top].tolist()))
+
+
 def _build_nl_summary(meta: MetaDescription, metadata: dict[str, Any]) -> str:
     obj_type = meta.get("object_type", "pandas")
     if metadata.get("type") == "dataframe":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import stat
 from pathlib import Path, PurePath
 from typing import Any
 
@@ -38,13 +39,21 @@ class PathlibAdapter:
 
         if isinstance(obj, Path):
             try:
-                exists = obj.exists()
+                # One stat() instead of exists()/is_file()/is_dir() each
+                # stat-ing again. Like exists(), any OS error means "no".
+                try:
+                    st = obj.stat()
+                except (OSError, ValueError):
+                    st = None
+                exists = st is not None
                 metadata["exists"] = exists
                 if exists:
-                    metadata["is_file"] = obj.is_file()
-                    metadata["is_dir"] = obj.is_dir()
-                    if obj.is_file():
-                        size = obj.stat().st_size
+                    is_file = stat.S_ISREG(st.st_mode)
+                    is_dir = stat.S_ISDIR(st.st_mode)
+                    metadata["is_file"] = is_file
+                    metadata["is_dir"] = is_dir
+                    if is_file:
+                        size = st.st_size
                         metadata["size_bytes"] = size
                         metadata["size"] = format_bytes(size)
                         # Describe the file's *content* with the zero-dependency
@@ -53,7 +62,7 @@ class PathlibAdapter:
                         content = _sniff_file(obj)
                         if content:
                             metadata["content"] = content
-                    elif obj.is_dir():
+                    elif is_dir:
                         # Recursively describe directory contents
                         tree_result = _describe_directory_tree(
                             obj,
@@ -113,8 +122,12 @@ def _describe_directory_tree(
             return
 
         try:
-            # Get and sort directory entries
-            entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name))
+            # Get and sort directory entries, stat-ing each entry once: the
+            # is_dir flag is needed for both the sort key and the walk below.
+            entries = sorted(
+                ((entry, entry.is_dir()) for entry in path.iterdir()),
+                key=lambda item: (not item[1], item[0].name),
+            )
         except PermissionError:
             tree_lines.append(f"{prefix}... (permission denied)")
             return
@@ -122,7 +135,7 @@ def _describe_directory_tree(
             tree_lines.append(f"{prefix}... (error: {e!s})")
             return
 
-        for i, entry in enumerate(entries):
+        for i, (entry, entry_is_dir) in enumerate(entries):
             if files_processed >= max_files:
                 tree_lines.append(f"{prefix}... (max files reached)")
                 break
@@ -132,7 +145,7 @@ def _describe_directory_tree(
             extension = "    " if is_last else "│   "
 
             try:
-                if entry.is_dir():
+                if entry_is_dir:
                     dir_count += 1
                     tree_lines.append(f"{prefix}{connector}{entry.name}/")
                     _walk_directory(entry, prefix + extension, depth + 1)
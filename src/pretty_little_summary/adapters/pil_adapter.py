@@ -17,6 +17,11 @@ from pretty_little_summary.core import MetaDescription
 class PILAdapter:
     """Adapter for PIL.Image.Image and lists of images."""
 
+    # Lists qualify only when their items are images.
+    TYPE_DISPATCH = False
+
+    handled_types = (Image.Image, list) if LIBRARY_AVAILABLE else ()
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if not LIBRARY_AVAILABLE:
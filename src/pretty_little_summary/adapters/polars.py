@@ -17,6 +17,8 @@ from pretty_little_summary.descriptor_utils import safe_repr
 class PolarsAdapter:
     """Adapter for Polars DataFrame/LazyFrame."""
 
+    handled_types = (pl.DataFrame, pl.LazyFrame) if LIBRARY_AVAILABLE else ()
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if not LIBRARY_AVAILABLE:
@@ -29,8 +31,6 @@ class PolarsAdapter:
     @staticmethod
     def extract_metadata(obj: Any) -> MetaDescription:
         try:
-            import polars as pl
-
             is_lazy = isinstance(obj, pl.LazyFrame)
             config = DescribeConfigRegistry.get()
 
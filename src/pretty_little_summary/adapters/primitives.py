@@ -17,6 +17,26 @@ from pretty_little_summary.core import MetaDescription
 from pretty_little_summary.descriptor_registry import DescribeConfigRegistry
 from pretty_little_summary.descriptor_utils import format_bytes, safe_repr
 
+# Short-string pattern detectors, compiled once. All are anchored with match()
+# and have no nested ambiguous quantifiers; inputs are also capped at 100
+# characters by the short-string gate in extract_metadata, which bounds the
+# little backtracking that remains (e.g. the dotted email domain).
+_URL_RE = re.compile(r"^https?://[^\s<>]+$")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_ISO_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}")
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I
+)
+_UNIX_PATH_RE = re.compile(r"^(?:/[^/\0]+)+/?$")
+_WINDOWS_PATH_RE = re.compile(
+    r"^[A-Za-z]:\\(?:[^\\/:*?\"<>|\r\n]+\\)*[^\\/:*?\"<>|\r\n]*$"
+)
+_PHONE_RE = re.compile(r"\b(?:\+?1?[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b")
+_HEX_COLOR_RE = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
+_IP_ADDRESS_RE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+_MD_HEADING_START_RE = re.compile(r"\s*#")
+
 
 class PrimitiveAdapter:
     """Adapter for primitive built-in types."""
@@ -90,19 +110,35 @@ def _describe_int(value: int) -> dict[str, Any]:
     return metadata
 
 
+# Checked in order, so earlier ranges win where they overlap. The last range
+# covers everything up to 65535, so any small non-negative int gets a label.
+_INT_RANGES = (
+    (1900, 2100, "year"),
+    (100, 599, "http_status"),
+    (0, 255, "exit_code"),
+    (0, 65535, "port_number"),
+)
+
+# Same convention for floats; values outside [-180, 180] skip straight to the
+# currency check.
+_FLOAT_RANGES = (
+    (0, 1, "probability"),
+    (0, 100, "percentage"),
+    (-90, 90, "latitude"),
+    (-180, 180, "longitude"),
+)
+
+
 def _detect_int_special(value: int) -> dict[str, Any] | None:
-    if value == 0:
+    if value <= 0:
+        # No special form covers zero or negative integers.
         return None
-    if value > 0 and (value & (value - 1) == 0):
+    if value & (value - 1) == 0:
         return {"type": "bit_flag", "bit": int(math.log2(value))}
-    if 1900 <= value <= 2100:
-        return {"type": "year", "value": value}
-    if 100 <= value <= 599:
-        return {"type": "http_status", "value": value}
-    if 0 <= value <= 255:
-        return {"type": "exit_code", "value": value}
-    if 0 <= value <= 65535:
-        return {"type": "port_number", "value": value}
+    if value <= 65535:
+        for lo, hi, name in _INT_RANGES:
+            if lo <= value <= hi:
+                return {"type": name, "value": value}
     if value >= 1_000_000_000:
         try:
             dt = datetime.utcfromtimestamp(value)
@@ -226,14 +262,10 @@ def _float_precision(value: float) -> int | None:
 
 
 def _detect_float_pattern(value: float) -> str | None:
-    if 0 <= value <= 1:
-        return "probability"
-    if 0 <= value <= 100:
-        return "percentage"
-    if -90 <= value <= 90:
-        return "latitude"
     if -180 <= value <= 180:
-        return "longitude"
+        for lo, hi, name in _FLOAT_RANGES:
+            if lo <= value <= hi:
+                return name
     if abs(value) < 1_000_000 and round(value, 2) == value:
         return "currency_like"
     return None
@@ -301,10 +333,11 @@ def _detect_short_string_pattern(value: str) -> str | None:
         return "url"
     if _is_email(value):
         return "email"
-    if _is_iso_date(value):
-        return "iso_date"
-    if _is_iso_datetime(value):
-        return "iso_datetime"
+    if _has_iso_date_prefix(value):
+        if _is_iso_date(value):
+            return "iso_date"
+        if _is_iso_datetime(value):
+            return "iso_datetime"
     if _is_uuid(value):
         return "uuid"
     if _is_file_path(value):
@@ -338,7 +371,8 @@ def _detect_document_type(value: str) -> str | None:
 
 
 def _describe_bytes(obj: bytes | bytearray) -> dict[str, Any]:
-    data = bytes(obj)
+    # Everything below reads bytearray as-is; no need for a full bytes copy.
+    data = obj
     length = len(data)
     preview_hex = data[:20].hex()
     detected = _detect_magic_bytes(data)
@@ -360,24 +394,37 @@ def _describe_bytes(obj: bytes | bytearray) -> dict[str, Any]:
     return metadata
 
 
-def _detect_magic_bytes(data: bytes) -> str | None:
-    signatures = {
-        b"\x89PNG\r\n\x1a\n": "png",
-        b"\xff\xd8\xff": "jpeg",
-        b"GIF87a": "gif",
-        b"GIF89a": "gif",
-        b"%PDF": "pdf",
-        b"PK\x03\x04": "zip",
-        b"\x1f\x8b": "gzip",
-        b"SQLite format 3\x00": "sqlite",
-    }
-    for sig, name in signatures.items():
-        if data.startswith(sig):
+_MAGIC_SIGNATURES = {
+    b"\x89PNG\r\n\x1a\n": "png",
+    b"\xff\xd8\xff": "jpeg",
+    b"GIF87a": "gif",
+    b"GIF89a": "gif",
+    b"%PDF": "pdf",
+    b"PK\x03\x04": "zip",
+    b"\x1f\x8b": "gzip",
+    b"SQLite format 3\x00": "sqlite",
+}
+# Signatures grouped by length, longest first: one dict probe per distinct
+# length instead of a startswith() per signature.
+_MAGIC_BY_LENGTH = tuple(
+    (length, {sig: name for sig, name in _MAGIC_SIGNATURES.items() if len(sig) == length})
+    for length in sorted({len(sig) for sig in _MAGIC_SIGNATURES}, reverse=True)
+)
+_MAGIC_MAX_LENGTH = _MAGIC_BY_LENGTH[0][0]
+
+
+def _detect_magic_bytes(data: bytes | bytearray) -> str | None:
+    # One short bytes copy of the header (hashable even for bytearray input);
+    # the per-length prefixes are sliced from it.
+    head = bytes(data[:_MAGIC_MAX_LENGTH])
+    for length, signatures in _MAGIC_BY_LENGTH:
+        name = signatures.get(head[:length])
+        if name is not None:
             return name
     return None
 
 
-def _entropy(data: bytes) -> float:
+def _entropy(data: bytes | bytearray) -> float:
     counts = Counter(data)
     total = len(data)
     if total == 0:
@@ -385,7 +432,7 @@ def _entropy(data: bytes) -> float:
     return -sum((count / total) * math.log2(count / total) for count in counts.values())
 
 
-def _is_valid_utf8(data: bytes) -> bool:
+def _is_valid_utf8(data: bytes | bytearray) -> bool:
     try:
         data.decode("utf-8")
         return True
@@ -409,59 +456,74 @@ def _looks_like_json(value: str) -> bool:
 
 
 def _is_url(value: str) -> bool:
-    return bool(re.match(r"^https?://[^\s<>]+$", value))
+    # Prefix test first: most strings are not URLs and never reach the regex.
+    if not value.startswith(("http://", "https://")):
+        return False
+    return _URL_RE.match(value) is not None
+
+
+# Each detector below first checks a character the pattern requires at a fixed
+# position (or anywhere, for "@"), so most strings are rejected by one C-level
+# string operation before the regex runs.
 
 
 def _is_email(value: str) -> bool:
-    return bool(re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", value))
+    if "@" not in value:
+        return False
+    return _EMAIL_RE.match(value) is not None
+
+
+def _has_iso_date_prefix(value: str) -> bool:
+    # Cheap gate for both ISO regexes: they need at least YYYY-MM-DD.
+    return len(value) >= 10 and value[4] == "-" and value[:4].isdigit()
 
 
 def _is_iso_date(value: str) -> bool:
-    return bool(re.match(r"^\d{4}-\d{2}-\d{2}$", value))
+    return _ISO_DATE_RE.match(value) is not None
 
 
 def _is_iso_datetime(value: str) -> bool:
-    return bool(re.match(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}", value))
+    return _ISO_DATETIME_RE.match(value) is not None
 
 
 def _is_uuid(value: str) -> bool:
-    return bool(
-        re.match(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-            value,
-            re.I,
-        )
-    )
+    if len(value) < 36:
+        return False
+    return _UUID_RE.match(value) is not None
 
 
 def _is_file_path(value: str) -> bool:
-    unix = re.match(r"^(/[^/\0]+)+/?$", value)
-    windows = re.match(
-        r"^[A-Za-z]:\\(?:[^\\/:*?\"<>|\r\n]+\\)*[^\\/:*?\"<>|\r\n]*$",
-        value,
-    )
-    return bool(unix or windows)
+    if value.startswith("/"):
+        return _UNIX_PATH_RE.match(value) is not None
+    if value[1:3] == ":\\":
+        return _WINDOWS_PATH_RE.match(value) is not None
+    return False
 
 
 def _is_phone(value: str) -> bool:
-    return bool(
-        re.match(
-            r"\b(\+?1?[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b",
-            value,
-        )
-    )
+    # The leading \b needs a word character first, and the only ones the
+    # pattern can start with are digits.
+    if not value[:1].isdigit():
+        return False
+    return _PHONE_RE.match(value) is not None
 
 
 def _is_hex_color(value: str) -> bool:
-    return bool(re.match(r"^#(?:[0-9a-fA-F]{3}){1,2}$", value))
+    if not value.startswith("#"):
+        return False
+    return _HEX_COLOR_RE.match(value) is not None
 
 
 def _is_ip_address(value: str) -> bool:
-    return bool(re.match(r"^\d{1,3}(\.\d{1,3}){3}$", value))
+    if not value[:1].isdigit():
+        return False
+    return _IP_ADDRESS_RE.match(value) is not None
 
 
 def _looks_like_markdown(value: str) -> bool:
-    return value.lstrip().startswith("#") or "```" in value
+    # match() only walks the leading whitespace; lstrip() would copy the
+    # whole document first.
+    return _MD_HEADING_START_RE.match(value) is not None or "```" in value
 
 
 def _looks_like_python(value: str) -> bool:
@@ -37,12 +37,15 @@ class PyArrowAdapter:
         }
         metadata: dict[str, Any] = {}
         try:
-            metadata.update(_describe_table(obj))
-            meta["shape"] = (obj.num_rows, obj.num_columns)
+            rows = obj.num_rows
+            cols = obj.num_columns
+            metadata.update(_describe_table(obj, rows, cols))
+            meta["shape"] = (rows, cols)
             try:
-                rows = obj.num_rows
-                cols = obj.num_columns
-                if rows * cols <= config.max_sample_cells and rows <= config.max_sample_rows:
+                if rows == 0:
+                    # Nothing to sample; skip the slice/to_pylist round trip.
+                    metadata["sample_rows"] = []
+                elif rows * cols <= config.max_sample_cells and rows <= config.max_sample_rows:
                     sample = obj.slice(0, min(config.sample_size, rows)).to_pylist()
                     metadata["sample_rows"] = [
                         {str(k): safe_repr(v, config.max_sample_repr) for k, v in row.items()}
@@ -61,13 +64,16 @@ class PyArrowAdapter:
         return meta
 
 
-def _describe_table(table: pa.Table) -> dict[str, Any]:
-    schema = {field.name: str(field.type) for field in table.schema}
+def _describe_table(table: pa.Table, rows: int, cols: int) -> dict[str, Any]:
+    # Only schema-level accessors here: nothing below touches column data.
+    # names/types come back as plain lists, so no Field wrapper per column.
+    arrow_schema = table.schema
+    schema = dict(zip(arrow_schema.names, map(str, arrow_schema.types)))
     size = table.nbytes
     return {
         "type": "pyarrow_table",
-        "rows": table.num_rows,
-        "columns": table.num_columns,
+        "rows": rows,
+        "columns": cols,
         "schema": schema,
         "memory_bytes": size,
         "memory": format_bytes(size),
@@ -5,6 +5,9 @@ from typing import Any
 from pretty_little_summary.adapters._base import AdapterRegistry, module_loaded
 from pretty_little_summary.core import MetaDescription
 
+# Longest repr kept per top-level child; a transformer block's repr runs to KBs.
+_MAX_CHILD_REPR = 2000
+
 
 class PytorchAdapter:
     """Adapter for PyTorch nn.Module and Tensor objects.
@@ -53,33 +56,43 @@ class PytorchAdapter:
 
             # Get architecture via named_children
             try:
-                architecture = {name: str(child) for name, child in obj.named_children()}
+                architecture = {}
+                for name, child in obj.named_children():
+                    text = str(child)
+                    if len(text) > _MAX_CHILD_REPR:
+                        text = (
+                            f"{text[:_MAX_CHILD_REPR]}... "
+                            f"({child.__class__.__name__}, truncated)"
+                        )
+                    architecture[name] = text
                 if architecture:
                     meta["metadata"] = {"architecture": architecture}
             except Exception as e:
                 meta.setdefault("warnings", []).append(f"Could not get architecture: {e}")
 
-            # Calculate parameter counts
+            # Count parameters and find the device in a single traversal
             try:
-                total_params = sum(p.numel() for p in obj.parameters())
-                trainable_params = sum(p.numel() for p in obj.parameters() if p.requires_grad)
+                total_params = 0
+                trainable_params = 0
+                first_param = None
+                for p in obj.parameters():
+                    n = p.numel()
+                    total_params += n
+                    if p.requires_grad:
+                        trainable_params += n
+                    if first_param is None:
+                        first_param = p
                 meta["parameter_count"] = total_params
                 meta["parameters"] = {
                     "total": total_params,
                     "trainable": trainable_params,
                 }
+                if first_param is not None:
+                    meta["metadata"] = meta.get("metadata", {})
+                    meta["metadata"]["device"] = str(first_param.device)
             except Exception as e:
                 meta.setdefault("warnings", []).append(f"Could not count parameters: {e}")
 
-            # Get device
-            try:
-                params = list(obj.parameters())
-                if params:
-                    meta["metadata"] = meta.get("metadata", {})
-                    meta["metadata"]["device"] = str(params[0].device)
-            except Exception:
-                pass
-
             meta["nl_summary"] = f"A PyTorch model {meta['object_type']}."
             return meta
 
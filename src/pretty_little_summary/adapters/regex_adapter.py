@@ -57,12 +57,13 @@ def _describe_match(match: re.Match) -> dict[str, Any]:
     }
 
 
+_RE_FLAGS = tuple(
+    (getattr(re, name), name) for name in ("IGNORECASE", "MULTILINE", "DOTALL", "VERBOSE", "ASCII")
+)
+
+
 def _format_flags(flags: int) -> list[str]:
-    flag_names = []
-    for name in ["IGNORECASE", "MULTILINE", "DOTALL", "VERBOSE", "ASCII"]:
-        if flags & getattr(re, name):
-            flag_names.append(name)
-    return flag_names
+    return [name for bit, name in _RE_FLAGS if flags & bit]
 
 
 AdapterRegistry.register(RegexAdapter)
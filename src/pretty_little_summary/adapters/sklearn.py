@@ -12,6 +12,9 @@ from pretty_little_summary.core import MetaDescription
 class SklearnAdapter:
     """Adapter for scikit-learn models."""
 
+    # Duck-typed on instance attributes.
+    TYPE_DISPATCH = False
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if not LIBRARY_AVAILABLE:
@@ -11,6 +11,9 @@ from pretty_little_summary.core import MetaDescription
 class SklearnPipelineAdapter:
     """Adapter for sklearn.pipeline.Pipeline."""
 
+    # Duck-typed on the instance's ``steps`` attribute.
+    TYPE_DISPATCH = False
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         return hasattr(obj, "steps") and isinstance(getattr(obj, "steps", None), list)
@@ -23,9 +26,7 @@ class SklearnPipelineAdapter:
         }
         metadata: dict[str, Any] = {"type": "sklearn_pipeline"}
         try:
-            steps = []
-            for name, step in obj.steps:
-                steps.append({"name": name, "class": step.__class__.__name__})
+            steps = [{"name": name, "class": type(step).__name__} for name, step in obj.steps]
             metadata["steps"] = steps
             metadata["step_count"] = len(steps)
         except Exception:
@@ -11,6 +11,9 @@ from pretty_little_summary.core import MetaDescription
 class StatsmodelsAdapter:
     """Adapter for statsmodels result objects."""
 
+    # Duck-typed on instance attributes.
+    TYPE_DISPATCH = False
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         module = type(obj).__module__
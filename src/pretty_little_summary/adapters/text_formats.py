@@ -22,6 +22,10 @@ from pretty_little_summary.descriptor_utils import safe_repr
 class TextFormatAdapter:
     """Adapter for strings that represent structured data formats."""
 
+    # Depends on the string content, not just the type.
+    TYPE_DISPATCH = False
+    handled_types = (str,)
+
     @staticmethod
     def can_handle(obj: Any) -> bool:
         if not isinstance(obj, str):
@@ -185,9 +189,13 @@ def _detect_xml(value: str) -> dict[str, Any] | None:
     return {"format": "xml", "root_tag": root.tag}
 
 
+_HTML_DOCUMENT_RE = re.compile(r"<!doctype\s+html|<html\b|<body\b|<head\b", re.I)
+_HTML_FRAGMENT_RE = re.compile(r"<(?:div|span|p|a|img|table|section)\b", re.I)
+
+
 def _detect_html(value: str) -> dict[str, Any] | None:
-    if not re.search(r"<!doctype\s+html|<html\b|<body\b|<head\b", value, re.I):
-        if not re.search(r"<(div|span|p|a|img|table|section)\b", value, re.I):
+    if not _HTML_DOCUMENT_RE.search(value):
+        if not _HTML_FRAGMENT_RE.search(value):
             return None
     return {"format": "html"}
 
@@ -246,20 +254,26 @@ def _infer_type(values: list[str]) -> str:
     return "str"
 
 
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.\d+")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+
+
 def _is_int(value: str) -> bool:
-    return re.fullmatch(r"-?\d+", value or "") is not None
+    return _INT_RE.fullmatch(value or "") is not None
 
 
 def _is_float(value: str) -> bool:
-    return re.fullmatch(r"-?\d+\.\d+", value or "") is not None
+    return _FLOAT_RE.fullmatch(value or "") is not None
 
 
 def _is_date(value: str) -> bool:
-    return re.fullmatch(r"\d{4}-\d{2}-\d{2}", value or "") is not None
+    return _DATE_RE.fullmatch(value or "") is not None
 
 
 def _is_email(value: str) -> bool:
-    return re.fullmatch(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", value or "") is not None
+    return _EMAIL_RE.fullmatch(value or "") is not None
 
 
 def _is_bool(value: str) -> bool:
@@ -22,15 +22,19 @@ class UUIDAdapter:
             "object_type": f"{type(obj).__module__}.{type(obj).__name__}",
             "adapter_used": "UUIDAdapter",
         }
+        # str(obj) and obj.hex each format the 128-bit int; do it once and
+        # insert the hyphens ourselves.
+        h = obj.hex
+        version = obj.version
         metadata: dict[str, Any] = {
             "type": "uuid",
-            "value": str(obj),
-            "version": obj.version,
+            "value": f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}",
+            "version": version,
             "variant": obj.variant,
-            "hex": obj.hex,
+            "hex": h,
         }
         meta["metadata"] = metadata
-        meta["nl_summary"] = f"A UUID (version {obj.version}): {metadata['value']}."
+        meta["nl_summary"] = f"A UUID (version {version}): {metadata['value']}."
         return meta
 
 
@@ -1,5 +1,6 @@
 """Xarray adapter."""
 
+from itertools import islice
 from typing import Any
 
 try:
@@ -11,6 +12,9 @@ except ImportError:
 from pretty_little_summary.adapters._base import AdapterRegistry
 from pretty_little_summary.core import MetaDescription
 
+# Datasets can carry thousands of variables; list at most this many names.
+_MAX_NAMES = 100
+
 
 class XarrayAdapter:
     """Adapter for Xarray DataArray/Dataset."""
@@ -27,8 +31,6 @@ class XarrayAdapter:
     @staticmethod
     def extract_metadata(obj: Any) -> MetaDescription:
         try:
-            import xarray as xr
-
             from pretty_little_summary.descriptor_registry import DescribeConfigRegistry
 
             config = DescribeConfigRegistry.get()
@@ -39,41 +41,41 @@ class XarrayAdapter:
                 "object_type": "xarray.Dataset" if is_dataset else "xarray.DataArray",
                 "adapter_used": "XarrayAdapter",
             }
+            md: dict[str, Any] = {}
 
             # Dimensions
             try:
                 if is_dataset:
                     # For Dataset, get dims from data_vars
                     dims_info = {}
-                    for var_name, var in obj.data_vars.items():
+                    for var_name, var in islice(obj.data_vars.items(), _MAX_NAMES):
                         dims_info[var_name] = dict(var.dims)
-                    meta["metadata"] = {"dimensions": dims_info}
+                    md["dimensions"] = dims_info
                 else:
                     # For DataArray
-                    meta["metadata"] = {"dimensions": dict(obj.dims)}
+                    md["dimensions"] = dict(obj.dims)
             except Exception as e:
                 meta.setdefault("warnings", []).append(f"Could not get dimensions: {e}")
 
             # Coordinates
             try:
-                meta["metadata"] = meta.get("metadata", {})
-                meta["metadata"]["coordinates"] = list(obj.coords.keys())
+                md["coordinates"] = list(islice(obj.coords.keys(), _MAX_NAMES))
             except Exception as e:
                 meta.setdefault("warnings", []).append(f"Could not get coordinates: {e}")
 
-            # Attributes (user-defined metadata)
+            # Attributes (user-defined metadata). Read the backing dict when it
+            # exists so an attr-less object doesn't get one created on access.
             try:
-                if obj.attrs:
-                    meta["metadata"] = meta.get("metadata", {})
-                    meta["metadata"]["attrs"] = obj.attrs
+                attrs = obj._attrs if hasattr(obj, "_attrs") else obj.attrs
+                if attrs:
+                    md["attrs"] = attrs
             except Exception as e:
                 meta.setdefault("warnings", []).append(f"Could not get attrs: {e}")
 
             # Data variables (Dataset only)
             if is_dataset:
                 try:
-                    meta["metadata"] = meta.get("metadata", {})
-                    meta["metadata"]["data_vars"] = list(obj.data_vars.keys())
+                    md["data_vars"] = list(islice(obj.data_vars.keys(), _MAX_NAMES))
                 except Exception as e:
                     meta.setdefault("warnings", []).append(f"Could not get data_vars: {e}")
 
@@ -84,13 +86,13 @@ class XarrayAdapter:
 
             try:
                 if not is_dataset and obj.size <= config.max_sample_elements:
-                    values = obj.values.ravel()[: config.sample_size].tolist()
-                    meta["metadata"] = meta.get("metadata", {})
-                    meta["metadata"]["sample_values"] = values
+                    md["sample_values"] = obj.values.ravel()[: config.sample_size].tolist()
             except Exception:
                 pass
 
-            sample_values = meta.get("metadata", {}).get("sample_values")
+            if md:
+                meta["metadata"] = md
+            sample_values = md.get("sample_values")
             if sample_values:
                 meta["nl_summary"] = (
                     f"An xarray object {meta['object_type']} with shape {meta.get('shape')}. "
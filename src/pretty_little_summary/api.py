@@ -1,10 +1,18 @@
 """Main API entry point for pretty_little_summary."""
 
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
-from pretty_little_summary.adapters import dispatch_adapter
-from pretty_little_summary.core import HistorySlicer
+from pretty_little_summary.adapters import (
+    dispatch_adapter,
+    dispatch_many,
+    load_adapters_for_loaded_libraries,
+)
+from pretty_little_summary.adapters._base import _dispatch_loaded
+from pretty_little_summary.core import HistorySlicer, MetaDescription
+from pretty_little_summary.descriptor_registry import DescribeConfigRegistry
 from pretty_little_summary.synthesizer import deterministic_summary
 
 
@@ -24,7 +32,7 @@ class Description:
     history: list[str] | None
 
 
-def describe(obj: Any, name: str | None = None) -> Description:
+def describe(obj: Any, name: str | None = None, with_history: bool = True) -> Description:
     """
     Generate a structured summary of any Python object.
 
@@ -37,6 +45,8 @@ def describe(obj: Any, name: str | None = None) -> Description:
         obj: Any Python object to analyze
         name: Optional variable name for history filtering.
               If None, attempts to auto-detect from calling context.
+        with_history: If False, skip variable-name detection and IPython
+              history lookup entirely (``history`` is then None).
 
     Returns:
         Description object with content, meta, and history attributes
@@ -51,16 +61,79 @@ def describe(obj: Any, name: str | None = None) -> Description:
         >>> print(result.meta)
         {'object_type': 'pandas.DataFrame', 'shape': (1000, 5), ...}
     """
+    use_history = with_history and HistorySlicer.is_ipython_environment()
+    return _describe_one(obj, name, use_history)
+
+
+def describe_many(
+    objs: Iterable[Any],
+    names: Sequence[str | None] | None = None,
+    with_history: bool = True,
+) -> list[Description]:
+    """
+    Describe several objects in one call.
+
+    Equivalent to ``[describe(obj) for obj in objs]`` but does the per-call
+    setup (adapter loading, IPython environment detection) once for the batch.
+    With ``DescribeConfig.extract_workers > 1``, metadata extraction runs on a
+    thread pool so GIL-releasing adapters (NumPy, pandas, h5py reads) overlap;
+    name detection and history stay on the calling thread since they touch
+    IPython state.
+
+    Args:
+        objs: Objects to analyze
+        names: Optional variable names, one per object (None entries are
+               auto-detected like in :func:`describe`)
+        with_history: If False, skip name detection and history lookup
+
+    Returns:
+        One Description per object, in input order
+
+    Raises:
+        ValueError: If names is given and its length differs from objs
+    """
+    objs = list(objs)
+    if names is None:
+        names = [None] * len(objs)
+    elif len(names) != len(objs):
+        raise ValueError(f"Got {len(names)} names for {len(objs)} objects")
+
+    use_history = with_history and HistorySlicer.is_ipython_environment()
+    # Resolve names before extraction so they see the namespace as the caller left it.
+    if use_history:
+        names = [_try_get_variable_name(o) if n is None else n for o, n in zip(objs, names)]
+
+    workers = DescribeConfigRegistry.get().extract_workers
+    if workers <= 1 or len(objs) <= 1:
+        metadatas = dispatch_many(objs)
+    else:
+        # Load adapters once, on this thread, and have workers skip the load
+        # step: a worker importing an adapter would re-sort the registry while
+        # other workers are walking it.
+        load_adapters_for_loaded_libraries()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            metadatas = list(executor.map(_dispatch_loaded, objs))
+    return [
+        _describe_one(obj, name, use_history, metadata)
+        for obj, name, metadata in zip(objs, names, metadatas)
+    ]
+
+
+def _describe_one(
+    obj: Any, name: str | None, use_history: bool, metadata: MetaDescription | None = None
+) -> Description:
+    """Run the describe pipeline for one object (metadata may be precomputed)."""
     # Auto-detect variable name if not provided
-    if name is None:
+    if name is None and use_history:
         name = _try_get_variable_name(obj)
 
     # Extract metadata using adapter system
-    metadata = dispatch_adapter(obj)
+    if metadata is None:
+        metadata = dispatch_adapter(obj)
 
     # Get history if available
     history: list[str] | None = None
-    if HistorySlicer.is_ipython_environment():
+    if use_history:
         history = HistorySlicer.get_history(var_name=name, max_lines=50)
 
     # Generate deterministic summary
@@ -70,6 +143,10 @@ def describe(obj: Any, name: str | None = None) -> Description:
     return Description(content=content, meta=metadata, history=history)
 
 
+# id(shell) -> (execution_count, {id(value): name}) for the IPython namespace.
+_ns_index: dict[int, tuple[int, dict[int, str]]] = {}
+
+
 def _try_get_variable_name(obj: Any) -> str | None:
     """
     Attempt to auto-detect variable name from IPython namespace.
@@ -79,6 +156,13 @@ def _try_get_variable_name(obj: Any) -> str | None:
     - Find variable(s) that reference the same object (using `is`)
     - Return the first match (or None)
 
+    The reverse ``id -> name`` index is built once per execution count; a hit is
+    re-checked with ``is`` and a miss or stale hit rebuilds it, so names bound
+    later in the same cell are still found. A hit is returned as long as that
+    name is still bound to the object: if an earlier name in the namespace is
+    rebound to the same object within the same execution count, the cached
+    (later) name is returned rather than the first one in namespace order.
+
     This is best-effort; may not work for complex cases.
 
     Args:
@@ -94,11 +178,23 @@ def _try_get_variable_name(obj: Any) -> str | None:
         if ip is None:
             return None
 
-        # Search namespace for matching object
-        for var_name, var_obj in ip.user_ns.items():
-            if var_obj is obj and not var_name.startswith("_"):
+        user_ns = ip.user_ns
+        generation = getattr(ip, "execution_count", None)
+        cached = _ns_index.get(id(ip))
+        if cached is not None and cached[0] == generation:
+            var_name = cached[1].get(id(obj))
+            if var_name is not None and user_ns.get(var_name) is obj:
                 return var_name
 
+        # Reversed so the first matching name in namespace order wins.
+        index = {
+            id(var_obj): var_name
+            for var_name, var_obj in reversed(list(user_ns.items()))
+            if not var_name.startswith("_")
+        }
+        _ns_index[id(ip)] = (generation, index)
+        return index.get(id(obj))
+
     except (ImportError, AttributeError):
         pass
 
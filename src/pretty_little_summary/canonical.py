@@ -34,6 +34,9 @@ _MEM_ADDRESS_RE = re.compile(r" at 0x[0-9A-Fa-f]+")
 
 def strip_memory_addresses(text: str) -> str:
     """Remove ``at 0x…`` instance addresses so reprs are run-stable."""
+    # Nearly every repr has no address; a substring test is far cheaper than sub().
+    if " at 0x" not in text:
+        return text
     return _MEM_ADDRESS_RE.sub("", text)
 
 # Precision used when a float has no exact short decimal form. Python's float
@@ -1,5 +1,6 @@
 """Core types and utilities for Pretty Little Summary."""
 
+import sys
 from typing import Any, TypedDict
 
 
@@ -19,7 +20,7 @@ class MetaDescription(TypedDict, total=False):
     shape: tuple[int, ...] | None
     columns: list[str] | None
     dtypes: dict[str, str] | None
-    sample_data: str | None  # Markdown table or JSON
+    sample_data: str | list[dict[str, str]] | None  # Row records or a table string
 
     # Metadata extraction
     metadata: dict[str, Any] | None  # Generic metadata dict
@@ -70,6 +71,11 @@ class HistorySlicer:
         Returns:
             True if in IPython/Jupyter, False otherwise
         """
+        # A running IPython shell has always imported IPython; if it is not
+        # loaded there is no shell, and importing it just to ask would cost
+        # hundreds of modules on every describe().
+        if "IPython" not in sys.modules:
+            return False
         try:
             from IPython import get_ipython
 
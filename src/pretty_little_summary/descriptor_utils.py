@@ -71,6 +71,9 @@ class DescribeConfig:
     max_sample_elements: int = 1000
     max_sample_cells: int = 2000
     max_sample_rows: int = 10
+    numeric_sample_strategy: str = "stride"  # "stride", "random", "head"
+    extract_workers: int = 1  # describe_many threads for metadata extraction
+    sample_format: str = "records"  # DataFrame sample_data: "records", "markdown"
     allow_iterator_consumption: bool = False
     include_affordances: bool = True
     include_suggested_views: bool = True
@@ -172,6 +175,22 @@ def safe_repr(obj: Any, max_len: int = 50) -> str:
     return canonical_repr(obj, max_len)
 
 
+def safe_repr_many(values: Any, max_len: int = 50) -> list[str]:
+    """:func:`safe_repr` over a sequence, unboxing array-likes in one call.
+
+    ``tolist()`` on an ndarray / Index / Series converts every element to a
+    Python scalar at C level, so the per-element unwrap becomes a no-op.
+    Output is identical to ``[safe_repr(v, max_len) for v in values]``.
+    """
+    tolist = getattr(values, "tolist", None)
+    if callable(tolist):
+        try:
+            values = tolist()
+        except Exception:
+            pass
+    return [canonical_repr(v, max_len) for v in values]
+
+
 def safe_str(obj: Any, max_len: int = 100) -> str:
     """Safe, version-stable str with a length limit."""
     return canonical_str(obj, max_len)
@@ -223,10 +242,17 @@ class NumericStats:
 def compute_numeric_stats(
     values: Sequence[float | int], sample_limit: int = 10000
 ) -> NumericStats | None:
-    """Compute statistics for numeric sequence."""
+    """Compute statistics for numeric sequence.
+
+    A NumPy array of int/uint/float dtype is reduced with vectorized NumPy calls
+    instead of a Python loop; the result fields mean the same in both paths.
+    """
     if values is None or len(values) == 0:
         return None
 
+    if getattr(getattr(values, "dtype", None), "kind", None) in _NUMERIC_ARRAY_KINDS:
+        return _compute_numeric_stats_array(values, sample_limit)
+
     if len(values) > sample_limit:
         values = _deterministic_sample(list(values), sample_limit)
 
@@ -258,15 +284,23 @@ def compute_numeric_stats(
     if not finite_vals:
         return None
 
+    # One sort serves min/max, median and quartiles. fmean/fsum are float-exact
+    # sums; statistics.mean/stdev go through Fractions and cost several times more.
     sorted_vals = sorted(finite_vals)
     n = len(sorted_vals)
+    mean = statistics.fmean(finite_vals)
+    std = None
+    if n > 1:
+        std = math.sqrt(math.fsum((v - mean) ** 2 for v in finite_vals) / (n - 1))
+    mid = n // 2
+    median = sorted_vals[mid] if n % 2 else (sorted_vals[mid - 1] + sorted_vals[mid]) / 2
 
     return NumericStats(
         min=sorted_vals[0],
         max=sorted_vals[-1],
-        mean=statistics.mean(finite_vals),
-        std=statistics.stdev(finite_vals) if n > 1 else None,
-        median=statistics.median(finite_vals),
+        mean=mean,
+        std=std,
+        median=median,
         q1=sorted_vals[n // 4] if n >= 4 else None,
         q3=sorted_vals[3 * n // 4] if n >= 4 else None,
         n_zeros=n_zeros,
@@ -276,6 +310,45 @@ def compute_numeric_stats(
     )
 
 
+_NUMERIC_ARRAY_KINDS = frozenset("iuf")
+
+
+def _compute_numeric_stats_array(values: Any, sample_limit: int) -> NumericStats | None:
+    """NumPy path of :func:`compute_numeric_stats` (numpy is already imported)."""
+    import numpy as np
+
+    arr = np.asarray(values, dtype=np.float64).ravel()
+    if arr.size > sample_limit:
+        idx = np.random.default_rng(0).choice(arr.size, sample_limit, replace=False)
+        arr = arr[np.sort(idx)]
+
+    finite_mask = np.isfinite(arr)
+    finite_vals = arr[finite_mask]
+    if finite_vals.size == 0:
+        return None
+
+    n_nan = int(np.count_nonzero(np.isnan(arr)))
+    # One sort serves min/max, median and quartiles; np.median would partition again.
+    sorted_vals = np.sort(finite_vals)
+    n = int(sorted_vals.size)
+    mean = finite_vals.mean()
+    deviations = finite_vals - mean
+
+    return NumericStats(
+        min=float(sorted_vals[0]),
+        max=float(sorted_vals[-1]),
+        mean=float(mean),
+        std=math.sqrt(float(np.dot(deviations, deviations)) / (n - 1)) if n > 1 else None,
+        median=float((sorted_vals[(n - 1) // 2] + sorted_vals[n // 2]) / 2),
+        q1=float(sorted_vals[n // 4]) if n >= 4 else None,
+        q3=float(sorted_vals[3 * n // 4]) if n >= 4 else None,
+        n_zeros=int(np.count_nonzero(finite_vals == 0)),
+        n_nan=n_nan,
+        n_inf=int(arr.size) - n - n_nan,
+        total=int(arr.size),
+    )
+
+
 # =============================================================================
 # CARDINALITY ANALYSIS
 # =============================================================================
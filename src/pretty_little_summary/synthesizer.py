@@ -1,8 +1,37 @@
 """Deterministic summary generation."""
 
+from itertools import islice
 
 from pretty_little_summary.core import MetaDescription
 
+# (metadata key, line template) for the descriptor fields rendered verbatim,
+# in output order. timezone is skipped when empty; trace_types is a list.
+_DESCRIPTOR_FIELDS: tuple[tuple[str, str], ...] = (
+    ("type", "Type: {}"),
+    ("name", "Name: {}"),
+    ("path", "Path: {}"),
+    ("iso", "ISO: {}"),
+    ("timezone", "Timezone: {}"),
+    ("pattern", "Pattern: {}"),
+    ("document_type", "Doc type: {}"),
+    ("format", "Format: {}"),
+    ("stats", "Stats: {}"),
+    ("cardinality", "Cardinality: {}"),
+    ("null_count", "Nulls: {}"),
+    ("memory_bytes", "Memory: {} bytes"),
+    ("dtype", "Dtype: {}"),
+    ("shape", "Shape: {}"),
+    ("trace_types", "Traces: {}"),
+    ("traces", "Trace count: {}"),
+    ("grid_type", "Grid: {}"),
+    ("axes_count", "Axes: {}"),
+)
+
+
+def _truncate(text: str, limit: int = 50) -> str:
+    """Cut ``text`` to ``limit`` characters, marking the cut with ``...``."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 def deterministic_summary(
     metadata: MetaDescription, history: list[str] | None = None
@@ -44,17 +73,17 @@ def deterministic_summary(
         columns = metadata["columns"]
         if columns:
             # Convert columns to strings (handles MultiIndex tuples, etc.)
-            col_strs = [str(c) for c in columns[:5]]
-            col_preview = ", ".join(col_strs)
-            if len(columns) > 5:
-                col_preview += f", ... ({len(columns)} total)"
+            n_columns = len(columns)
+            col_preview = ", ".join(map(str, islice(columns, 5)))
+            if n_columns > 5:
+                col_preview += f", ... ({n_columns} total)"
             lines.append(f"Columns: {col_preview}")
 
     # Dtypes (for DataFrames)
     if "dtypes" in metadata:
         dtypes = metadata["dtypes"]
         if dtypes and len(dtypes) <= 3:
-            lines.append(f"Types: {', '.join(f'{k}:{v}' for k, v in list(dtypes.items())[:3])}")
+            lines.append(f"Types: {', '.join(f'{k}:{v}' for k, v in dtypes.items())}")
 
     # Node/Edge counts (for graphs)
     if "node_count" in metadata:
@@ -75,10 +104,7 @@ def deterministic_summary(
     if "status_code" in metadata:
         lines.append(f"Status: {metadata['status_code']}")
     if "url" in metadata:
-        url = metadata["url"]
-        if len(url) > 50:
-            url = url[:50] + "..."
-        lines.append(f"URL: {url}")
+        lines.append(f"URL: {_truncate(metadata['url'])}")
 
     # Visualization metadata
     if "chart_type" in metadata:
@@ -104,7 +130,7 @@ def deterministic_summary(
         # Keys (for dicts)
         if "keys" in gen_meta:
             keys = gen_meta["keys"]
-            key_preview = ", ".join(str(k) for k in keys[:5])
+            key_preview = ", ".join(map(str, islice(keys, 5)))
             if len(keys) > 5:
                 key_preview += "..."
             lines.append(f"Keys: {key_preview}")
@@ -112,7 +138,9 @@ def deterministic_summary(
         # Sample items (for dicts/lists)
         if "sample_items" in gen_meta and isinstance(gen_meta["sample_items"], dict):
             # Dict sample
-            items_str = ", ".join(f"{k}: {v}" for k, v in list(gen_meta["sample_items"].items())[:3])
+            items_str = ", ".join(
+                f"{k}: {v}" for k, v in islice(gen_meta["sample_items"].items(), 3)
+            )
             lines.append(f"Sample: {{{items_str}}}")
 
         # Element types (for lists/tuples/sets)
@@ -122,64 +150,31 @@ def deterministic_summary(
 
         # Value (for simple types)
         if "value" in gen_meta:
-            val = gen_meta["value"]
-            val_str = str(val)
-            if len(val_str) > 50:
-                val_str = val_str[:50] + "..."
-            lines.append(f"Value: {val_str}")
+            lines.append(f"Value: {_truncate(str(gen_meta['value']))}")
 
         # Preview (for strings)
         if "preview" in gen_meta:
-            preview = gen_meta["preview"]
-            if len(preview) > 50:
-                preview = preview[:50] + "..."
-            lines.append(f'"{preview}"')
+            lines.append(f'"{_truncate(gen_meta["preview"])}"')
 
         # Attributes (for custom objects)
         if "attributes" in gen_meta:
             attrs = gen_meta["attributes"]
-            attr_preview = ", ".join(attrs[:5])
+            attr_preview = ", ".join(islice(attrs, 5))
             if len(attrs) > 5:
                 attr_preview += "..."
             lines.append(f"Attributes: {attr_preview}")
 
         # Common descriptor fields for stdlib adapters
-        if "type" in gen_meta:
-            lines.append(f"Type: {gen_meta['type']}")
-        if "name" in gen_meta:
-            lines.append(f"Name: {gen_meta['name']}")
-        if "path" in gen_meta:
-            lines.append(f"Path: {gen_meta['path']}")
-        if "iso" in gen_meta:
-            lines.append(f"ISO: {gen_meta['iso']}")
-        if gen_meta.get("timezone"):
-            lines.append(f"Timezone: {gen_meta['timezone']}")
-        if "pattern" in gen_meta:
-            lines.append(f"Pattern: {gen_meta['pattern']}")
-        if "document_type" in gen_meta:
-            lines.append(f"Doc type: {gen_meta['document_type']}")
-        if "format" in gen_meta:
-            lines.append(f"Format: {gen_meta['format']}")
-        if "stats" in gen_meta:
-            lines.append(f"Stats: {gen_meta['stats']}")
-        if "cardinality" in gen_meta:
-            lines.append(f"Cardinality: {gen_meta['cardinality']}")
-        if "null_count" in gen_meta:
-            lines.append(f"Nulls: {gen_meta['null_count']}")
-        if "memory_bytes" in gen_meta:
-            lines.append(f"Memory: {gen_meta['memory_bytes']} bytes")
-        if "dtype" in gen_meta:
-            lines.append(f"Dtype: {gen_meta['dtype']}")
-        if "shape" in gen_meta:
-            lines.append(f"Shape: {gen_meta['shape']}")
-        if "trace_types" in gen_meta:
-            lines.append(f"Traces: {', '.join(gen_meta['trace_types'])}")
-        if "traces" in gen_meta:
-            lines.append(f"Trace count: {gen_meta['traces']}")
-        if "grid_type" in gen_meta:
-            lines.append(f"Grid: {gen_meta['grid_type']}")
-        if "axes_count" in gen_meta:
-            lines.append(f"Axes: {gen_meta['axes_count']}")
+        for key, template in _DESCRIPTOR_FIELDS:
+            if key not in gen_meta:
+                continue
+            value = gen_meta[key]
+            if key == "timezone":
+                if not value:
+                    continue
+            elif key == "trace_types":
+                value = ", ".join(value)
+            lines.append(template.format(value))
     # Warnings
     if metadata.get("warnings"):
         lines.append(f"Warnings: {len(metadata['warnings'])} issue(s)")
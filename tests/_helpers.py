@@ -0,0 +1,53 @@
+"""Pytest helpers shared across test modules (kept out of tests.input)."""
+
+from __future__ import annotations
+
+from functools import cache
+from importlib.util import find_spec
+
+import pytest
+
+
+@cache
+def module_available(name: str) -> bool:
+    """Whether ``name`` is importable, probed once per session via ``find_spec``."""
+    try:
+        return find_spec(name) is not None
+    except ImportError:
+        # find_spec("a.b") imports "a"; a missing parent raises.
+        return False
+
+
+def requires(*modules: str) -> pytest.MarkDecorator:
+    """Skip a single test unless all optional ``modules`` are installed.
+
+    Unlike a module-level ``pytest.importorskip``, this skips only the
+    decorated test, so one missing library does not hide the rest of the file.
+    """
+    # Probe only the top-level package: find_spec("a.b") imports "a", which
+    # would pull heavy libraries in at collection time.
+    missing = [name for name in modules if not module_available(name.partition(".")[0])]
+    return pytest.mark.skipif(bool(missing), reason=f"Missing dependency: {', '.join(missing)}")
+
+
+def describe_example(example: dict):
+    """Build a tests/input example, ``pls.describe`` it, and release its handle.
+
+    Builders may return ``(obj, handle)`` where ``handle`` is something to
+    close (an open file) or a callable to run once the object is described.
+    """
+    import pretty_little_summary as pls
+    from tests.input import build_input
+
+    obj = build_input(example)
+    handle = None
+    if isinstance(obj, tuple) and len(obj) == 2:
+        obj, handle = obj
+    try:
+        return pls.describe(obj)
+    finally:
+        if handle is not None:
+            if hasattr(handle, "close"):
+                handle.close()
+            elif callable(handle):
+                handle()
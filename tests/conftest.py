@@ -19,3 +19,23 @@ sys.modules.pop("pretty_little_summary", None)
 def sample_dict():
     """Create a simple dictionary for testing."""
     return {"a": 1, "b": 2, "c": 3}
+
+
+@pytest.fixture(scope="session")
+def described_example():
+    """Describe a tests/input example once per session and reuse the result.
+
+    For read-only checks on ``pls.describe`` output. Tests that need a fresh
+    object (e.g. determinism across rebuilds) should build their own.
+    """
+    from tests._helpers import describe_example
+    from tests.input import load_example
+
+    cache = {}
+
+    def _describe(example_id: str):
+        if example_id not in cache:
+            cache[example_id] = describe_example(load_example(example_id))
+        return cache[example_id]
+
+    return _describe
@@ -14,9 +14,9 @@ import json
 
 import pytest
 
-import pretty_little_summary as pls
 from pretty_little_summary.adapters import AdapterRegistry, dispatch_adapter, load_all_adapters
-from tests.input import build_input, list_example_ids, load_example
+from tests._helpers import describe_example
+from tests.input import list_example_ids, load_example
 
 # An adapter's textual summary must stay bounded no matter how big the input is.
 MAX_CONTENT_CHARS = 50_000
@@ -46,34 +46,12 @@ def _describable_example_params():
     return params
 
 
-def _build(example):
-    """Build an example object, returning (obj, cleanup_or_None)."""
-    obj = build_input(example)
-    if isinstance(obj, tuple) and len(obj) == 2:
-        return obj
-    return obj, None
-
-
-def _cleanup(handle) -> None:
-    if handle is None:
-        return
-    if hasattr(handle, "close"):
-        handle.close()
-    elif callable(handle):
-        handle()
-
-
 EXAMPLE_PARAMS = _describable_example_params()
 
 
 @pytest.mark.parametrize("example_id", EXAMPLE_PARAMS)
-def test_describe_never_raises_and_is_wellformed(example_id: str) -> None:
-    example = load_example(example_id)
-    obj, cleanup = _build(example)
-    try:
-        result = pls.describe(obj)
-    finally:
-        _cleanup(cleanup)
+def test_describe_never_raises_and_is_wellformed(example_id: str, described_example) -> None:
+    result = described_example(example_id)
 
     # content: non-empty, bounded string.
     assert isinstance(result.content, str)
@@ -87,13 +65,8 @@ def test_describe_never_raises_and_is_wellformed(example_id: str) -> None:
 
 
 @pytest.mark.parametrize("example_id", EXAMPLE_PARAMS)
-def test_meta_is_json_serializable(example_id: str) -> None:
-    example = load_example(example_id)
-    obj, cleanup = _build(example)
-    try:
-        result = pls.describe(obj)
-    finally:
-        _cleanup(cleanup)
+def test_meta_is_json_serializable(example_id: str, described_example) -> None:
+    result = described_example(example_id)
 
     # The whole point of `meta` is that it is a portable, serializable fact
     # document. Tuples are acceptable (JSON encodes them as arrays); arbitrary
@@ -105,20 +78,12 @@ def test_meta_is_json_serializable(example_id: str) -> None:
 def test_describe_is_deterministic(example_id: str) -> None:
     example = load_example(example_id)
 
-    obj1, cleanup1 = _build(example)
-    try:
-        first = pls.describe(obj1)
-    finally:
-        _cleanup(cleanup1)
+    first = describe_example(example)
 
     # Rebuild a fresh object: some inputs (files, iterators) are consumed by the
     # first pass, so re-describing the same instance is not a fair determinism
     # test — re-describing an equivalent instance is.
-    obj2, cleanup2 = _build(example)
-    try:
-        second = pls.describe(obj2)
-    finally:
-        _cleanup(cleanup2)
+    second = describe_example(example)
 
     assert first.content == second.content, "content must be deterministic"
     assert json.dumps(first.meta, sort_keys=True, default=str) == json.dumps(
@@ -127,14 +92,9 @@ def test_describe_is_deterministic(example_id: str) -> None:
 
 
 @pytest.mark.parametrize("example_id", EXAMPLE_PARAMS)
-def test_no_unexpected_emergency_fallback(example_id: str) -> None:
+def test_no_unexpected_emergency_fallback(example_id: str, described_example) -> None:
     """Known-good example inputs should be handled by a real adapter path."""
-    example = load_example(example_id)
-    obj, cleanup = _build(example)
-    try:
-        result = pls.describe(obj)
-    finally:
-        _cleanup(cleanup)
+    result = described_example(example_id)
 
     assert "emergency fallback" not in result.meta.get("adapter_used", "")
 
@@ -170,3 +130,15 @@ def test_unknown_object_falls_back_to_generic() -> None:
     meta = dispatch_adapter(TotallyUnknown())
     assert "GenericAdapter" in meta["adapter_used"]
     assert meta["object_type"].endswith("TotallyUnknown")
+
+
+def test_reregistered_adapter_keeps_declared_position() -> None:
+    """Tiebreak order follows the declared module order, not import timing."""
+    load_all_adapters()
+    before = AdapterRegistry.adapters()
+    collections_adapter = next(a for a in before if a.__name__ == "CollectionsAdapter")
+
+    AdapterRegistry.unregister(collections_adapter)
+    AdapterRegistry.register(collections_adapter)
+
+    assert AdapterRegistry.adapters() == before
@@ -0,0 +1,47 @@
+"""Tests for api-level helpers."""
+
+from __future__ import annotations
+
+from pretty_little_summary import api
+from tests._helpers import requires
+
+pytestmark = requires("IPython")
+
+
+class _FakeShell:
+    def __init__(self, user_ns: dict) -> None:
+        self.user_ns = user_ns
+        self.execution_count = 1
+
+
+def test_variable_name_lookup_tracks_namespace(monkeypatch) -> None:
+    import IPython
+
+    obj, other = object(), object()
+    shell = _FakeShell({"_": obj, "first": obj, "second": obj})
+    monkeypatch.setattr(IPython, "get_ipython", lambda: shell)
+
+    assert api._try_get_variable_name(obj) == "first"
+    assert api._try_get_variable_name(other) is None
+
+    # Bound later in the same execution count: still found.
+    shell.user_ns["late"] = other
+    assert api._try_get_variable_name(other) == "late"
+
+    # Rebinding a cached name must not return a stale answer.
+    shell.user_ns["first"] = other
+    assert api._try_get_variable_name(obj) == "second"
+
+
+def test_describe_without_history_skips_ipython(monkeypatch) -> None:
+    from pretty_little_summary.core import HistorySlicer
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("history path should be skipped")
+
+    monkeypatch.setattr(HistorySlicer, "is_ipython_environment", staticmethod(_fail))
+    monkeypatch.setattr(api, "_try_get_variable_name", _fail)
+
+    result = api.describe([1, 2, 3], with_history=False)
+    assert result.history is None
+    assert result.content
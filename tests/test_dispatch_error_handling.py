@@ -4,7 +4,11 @@ from typing import Any
 from unittest.mock import patch
 
 import pretty_little_summary as pls
-from pretty_little_summary.adapters._base import AdapterRegistry, dispatch_adapter
+from pretty_little_summary.adapters._base import (
+    AdapterRegistry,
+    dispatch_adapter,
+    dispatch_many,
+)
 from pretty_little_summary.adapters.generic import GenericAdapter
 from pretty_little_summary.core import MetaDescription
 
@@ -308,3 +312,90 @@ def test_multiple_adapter_failures_in_sequence():
     finally:
         AdapterRegistry.unregister(FirstAdapter)
         AdapterRegistry.unregister(SecondAdapter)
+
+
+def test_type_cache_respects_later_registration():
+    """Registering an adapter must invalidate cached dispatch for that type."""
+    obj = CustomTestObject("cached")
+    assert AdapterRegistry.get_adapter(obj) is GenericAdapter
+
+    AdapterRegistry.register(BrokenAdapter, priority=10_000)
+    try:
+        assert AdapterRegistry.get_adapter(obj) is BrokenAdapter
+    finally:
+        AdapterRegistry.unregister(BrokenAdapter)
+
+    assert AdapterRegistry.get_adapter(obj) is GenericAdapter
+
+
+def test_type_cache_does_not_keep_dynamic_classes_alive():
+    """Dispatching an instance of a throwaway class must not pin the class."""
+    import gc
+    import weakref
+
+    dynamic_cls = type("Dynamic", (), {})
+    dispatch_adapter(dynamic_cls())
+    ref = weakref.ref(dynamic_cls)
+    del dynamic_cls
+    gc.collect()
+    assert ref() is None
+
+
+def test_value_dependent_adapter_is_asked_per_instance():
+    """TYPE_DISPATCH = False adapters are re-checked for each value of a type."""
+
+    class EvenOnlyAdapter:
+        TYPE_DISPATCH = False
+
+        @staticmethod
+        def can_handle(obj):
+            return isinstance(obj, CustomTestObject) and obj.value == "even"
+
+        @staticmethod
+        def extract_metadata(obj):
+            return {"object_type": "CustomTestObject", "adapter_used": "EvenOnlyAdapter"}
+
+    AdapterRegistry.register(EvenOnlyAdapter, priority=10_000)
+    try:
+        assert AdapterRegistry.get_adapter(CustomTestObject("odd")) is GenericAdapter
+        assert AdapterRegistry.get_adapter(CustomTestObject("even")) is EvenOnlyAdapter
+        assert AdapterRegistry.get_adapter(CustomTestObject("odd")) is GenericAdapter
+    finally:
+        AdapterRegistry.unregister(EvenOnlyAdapter)
+
+
+def test_handled_types_skips_can_handle_for_other_types():
+    """An adapter is never asked about objects outside its handled_types."""
+    calls: list[Any] = []
+
+    class RecordingAdapter:
+        handled_types = (CustomTestObject,)
+
+        @staticmethod
+        def can_handle(obj):
+            calls.append(obj)
+            return True
+
+        @staticmethod
+        def extract_metadata(obj):
+            return {"object_type": "CustomTestObject", "adapter_used": "RecordingAdapter"}
+
+    AdapterRegistry.register(RecordingAdapter, priority=10_000)
+    try:
+        assert AdapterRegistry.get_adapter(object()) is not RecordingAdapter
+        assert calls == []
+        assert AdapterRegistry.get_adapter(CustomTestObject()) is RecordingAdapter
+    finally:
+        AdapterRegistry.unregister(RecordingAdapter)
+
+
+def test_dispatch_many_matches_dispatch_adapter():
+    """dispatch_many keeps input order and the per-object fallback behavior."""
+    AdapterRegistry.register(BrokenAdapter, priority=10_000)
+    try:
+        objs = [1, "text", CustomTestObject("a"), [1, 2], CustomTestObject("b")]
+        metas = dispatch_many(objs)
+        assert metas == [dispatch_adapter(obj) for obj in objs]
+        assert "failed" in metas[2]["adapter_used"]
+    finally:
+        AdapterRegistry.unregister(BrokenAdapter)
@@ -1,13 +1,12 @@
 """Tests for h5py adapter."""
 
-import pytest
-
 from pretty_little_summary.adapters import dispatch_adapter
 from pretty_little_summary.synthesizer import deterministic_summary
+from tests._helpers import requires
 from tests.input import expected_output, load_example
 
 
-h5py = pytest.importorskip("h5py")
+pytestmark = requires("h5py")
 
 
 def test_h5py_dataset() -> None:
@@ -1,13 +1,16 @@
 """Tests for IPython display adapter."""
 
-import pytest
+import subprocess
+import sys
+from pathlib import Path
 
 from pretty_little_summary.adapters import dispatch_adapter
 from pretty_little_summary.synthesizer import deterministic_summary
+from tests._helpers import requires
 from tests.input import build_input, expected_output, load_example
 
 
-ipython = pytest.importorskip("IPython")
+pytestmark = requires("IPython")
 
 
 def test_ipython_display_adapter() -> None:
@@ -18,3 +21,20 @@ def test_ipython_display_adapter() -> None:
     summary = deterministic_summary(meta)
     print("ipython_display:", summary)
     assert summary == expected_output(example, meta)
+
+
+def test_rich_repr_object_dispatch_does_not_depend_on_ipython_import() -> None:
+    """A plain _repr_html_ object gets the display adapter before IPython is imported."""
+    src = Path(__file__).resolve().parents[1] / "src"
+    script = (
+        f"import sys; sys.path.insert(0, {str(src)!r})\n"
+        "import pretty_little_summary as pls\n"
+        "class Widget:\n"
+        "    def _repr_html_(self):\n"
+        "        return '<b>hi</b>'\n"
+        "print(pls.describe(Widget(), with_history=False).meta['adapter_used'])\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "IPythonDisplayAdapter"
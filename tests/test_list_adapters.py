@@ -67,3 +67,25 @@ def test_can_call_from_top_level():
     """Test that list_available_adapters is accessible from pretty_little_summary module."""
     assert hasattr(pls, "list_available_adapters")
     assert callable(pls.list_available_adapters)
+
+
+def test_list_available_adapters_tracks_registration():
+    """The cached name list is refreshed when the registry changes."""
+    from pretty_little_summary.adapters import AdapterRegistry
+
+    class ListedAdapter:
+        @staticmethod
+        def can_handle(obj):
+            return False
+
+        @staticmethod
+        def extract_metadata(obj):
+            return {}
+
+    assert "ListedAdapter" not in pls.list_available_adapters()
+    AdapterRegistry.register(ListedAdapter)
+    try:
+        assert "ListedAdapter" in pls.list_available_adapters()
+    finally:
+        AdapterRegistry.unregister(ListedAdapter)
+    assert "ListedAdapter" not in pls.list_available_adapters()
@@ -5,6 +5,12 @@ This test ensures the library functions correctly when optional
 dependencies (pandas, matplotlib, etc.) are not available.
 """
 
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 import pretty_little_summary as pls
 
 
@@ -129,3 +135,44 @@ def test_describe_without_optionals():
     """Test that describe works without optional dependencies."""
     result = pls.describe([1, 2, 3])
     assert result.content is not None
+
+
+def test_describe_does_not_import_unused_libraries():
+    """Describing builtins must not import optional libraries the caller never used."""
+    src = Path(__file__).resolve().parents[1] / "src"
+    script = (
+        f"import sys; sys.path.insert(0, {str(src)!r})\n"
+        "_HEAVY = ('pandas', 'polars', 'pyarrow', 'torch', 'xarray', 'matplotlib', 'numpy', 'IPython')\n"
+        "import pretty_little_summary as pls\n"
+        "pls.describe({'a': [1, 2, 3]})\n"
+        "print(sorted(m for m in _HEAVY if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_describe_many_matches_describe():
+    """describe_many returns one Description per object, in order."""
+    objs = [42, "hello", [1, 2, 3], {"a": 1}]
+    results = pls.describe_many(objs)
+    assert [r.content for r in results] == [pls.describe(o).content for o in objs]
+
+
+def test_describe_many_rejects_mismatched_names():
+    with pytest.raises(ValueError):
+        pls.describe_many([1, 2], names=["a"])
+
+
+def test_describe_many_with_extract_workers():
+    from pretty_little_summary.descriptor_registry import DescribeConfigRegistry
+
+    objs = [list(range(i)) for i in range(1, 9)]
+    original = DescribeConfigRegistry.get("default")
+    DescribeConfigRegistry.update("default", extract_workers=4)
+    try:
+        results = pls.describe_many(objs)
+    finally:
+        DescribeConfigRegistry.register("default", original)
+    assert [r.content for r in results] == [pls.describe(o).content for o in objs]
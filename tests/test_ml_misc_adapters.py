@@ -4,12 +4,12 @@ import pytest
 
 from pretty_little_summary.adapters import dispatch_adapter
 from pretty_little_summary.synthesizer import deterministic_summary
+from tests._helpers import requires
 from tests.input import build_input, expected_output, load_example
 
 
-tf = pytest.importorskip("tensorflow")
-
-
+@requires("tensorflow")
+@pytest.mark.slow
 def test_tensorflow_adapter() -> None:
     example = load_example("tensorflow_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -20,9 +20,8 @@ def test_tensorflow_adapter() -> None:
     assert summary == expected_output(example, meta)
 
 
-jax = pytest.importorskip("jax")
-
-
+@requires("jax")
+@pytest.mark.slow
 def test_jax_adapter() -> None:
     example = load_example("jax_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -33,9 +32,8 @@ def test_jax_adapter() -> None:
     assert summary == expected_output(example, meta)
 
 
-statsmodels = pytest.importorskip("statsmodels.api")
-
-
+@requires("statsmodels.api")
+@pytest.mark.slow
 def test_statsmodels_adapter() -> None:
     example = load_example("statsmodels_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -46,9 +44,8 @@ def test_statsmodels_adapter() -> None:
     assert summary == expected_output(example, meta)
 
 
-sklearn = pytest.importorskip("sklearn")
-
-
+@requires("sklearn")
+@pytest.mark.slow
 def test_sklearn_pipeline_adapter() -> None:
     example = load_example("sklearn_pipeline_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -36,3 +36,21 @@ def test_numpy_scalar() -> None:
     summary = deterministic_summary(meta)
     print("numpy_scalar:", summary)
     assert summary == expected_output(example, meta)
+
+
+def test_numeric_stats_array_path_matches_list_path() -> None:
+    from pretty_little_summary.descriptor_utils import compute_numeric_stats
+
+    arr = np.array([1, 2, 3, 4, 5, 0, 0, np.nan, np.inf, 7.5])
+    assert compute_numeric_stats(arr) == compute_numeric_stats(arr.tolist())
+
+
+def test_numeric_sample_spans_whole_array() -> None:
+    from pretty_little_summary.adapters.numpy_adapter import _sample_numeric_array
+
+    arr = np.arange(100_000)
+    for strategy in ("stride", "random"):
+        sample = _sample_numeric_array(arr, 10_000, strategy)
+        assert sample.size == 10_000
+        assert sample.max() > 90_000, strategy
+    assert _sample_numeric_array(arr, 10_000, "head").max() == 9_999
@@ -1,5 +1,7 @@
 """Tests for pandas adapter enhancements."""
 
+import json
+
 import pytest
 
 from pretty_little_summary.adapters import dispatch_adapter
@@ -71,3 +73,68 @@ def test_pandas_categorical() -> None:
     summary = deterministic_summary(meta)
     print("pandas_cat:", summary)
     assert summary == expected_output(example, meta)
+
+
+def test_pandas_categorical_top_counts() -> None:
+    cat = pd.Categorical([*"abbcccddddeeeeeffffffg", None])
+    meta = dispatch_adapter(cat)
+    assert meta["metadata"]["counts"] == {"f": 6, "e": 5, "d": 4, "c": 3, "b": 2}
+
+    ints = dispatch_adapter(pd.Categorical([1, 2, 2, 3, 3, 3]))
+    counts = ints["metadata"]["counts"]
+    assert counts == {3: 3, 2: 2, 1: 1}
+    assert json.loads(json.dumps(counts)) == {"3": 3, "2": 2, "1": 1}
+
+
+def test_pandas_index_metadata_tracks_in_place_rename() -> None:
+    index = pd.Index([3, 1, 2], name="ids")
+    assert dispatch_adapter(index)["metadata"]["name"] == "ids"
+    index.name = "renamed"
+    assert dispatch_adapter(index)["metadata"]["name"] == "renamed"
+
+
+def test_pandas_timestamp_metadata_is_independent_per_call() -> None:
+    ts = pd.Timestamp("2024-01-02 03:04:05")
+    first = dispatch_adapter(ts)
+    first["metadata"]["mutated"] = True
+    second = dispatch_adapter(ts)
+    assert "mutated" not in second["metadata"]
+    assert second["metadata"]["iso"] == "2024-01-02T03:04:05"
+
+
+def test_pandas_sample_data_converts_records_once() -> None:
+    import warnings
+
+    df = pd.DataFrame([[1, 2], [3, 4]], columns=["a", "a"])
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        meta = dispatch_adapter(df)
+    assert len([w for w in caught if "not unique" in str(w.message)]) == 1
+    assert meta["sample_data"] == meta["metadata"]["sample_rows"][:3]
+
+
+def test_safe_repr_many_matches_safe_repr() -> None:
+    from pretty_little_summary.descriptor_utils import safe_repr, safe_repr_many
+
+    for values in (
+        pd.Index([1, 2, 3]),
+        pd.Index([0.5, float("nan")]),
+        pd.Index(["a", "b" * 80]),
+        pd.date_range("2024-01-01", periods=2),
+        pd.Series([True, None], dtype="object"),
+    ):
+        assert safe_repr_many(values, 50) == [safe_repr(v, 50) for v in values]
+
+
+def test_column_sampling_is_repeatable() -> None:
+    df = pd.DataFrame({"x": range(30000), "y": [1.5, None, 2.5] * 10000})
+    first = dispatch_adapter(df)["metadata"]["column_analysis"]
+    assert dispatch_adapter(df)["metadata"]["column_analysis"] == first
+
+
+def test_memory_estimate_samples_string_index() -> None:
+    from pretty_little_summary.adapters.pandas import _estimate_memory_bytes
+
+    df = pd.DataFrame({"a": range(3000)}, index=[f"row-{i}" for i in range(3000)])
+    exact = int(df.memory_usage(deep=True).sum())
+    assert abs(_estimate_memory_bytes(df) - exact) < exact * 0.05
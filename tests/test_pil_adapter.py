@@ -1,13 +1,12 @@
 """Tests for PIL adapter."""
 
-import pytest
-
 from pretty_little_summary.adapters import dispatch_adapter
 from pretty_little_summary.synthesizer import deterministic_summary
+from tests._helpers import requires
 from tests.input import build_input, expected_output, load_example
 
 
-pil = pytest.importorskip("PIL")
+pytestmark = requires("PIL")
 
 
 def test_pil_image_adapter() -> None:
@@ -1,15 +1,12 @@
 """Tests for plotting adapters."""
 
-import pytest
-
 from pretty_little_summary.adapters import dispatch_adapter
 from pretty_little_summary.synthesizer import deterministic_summary
+from tests._helpers import requires
 from tests.input import build_input, expected_output, load_example
 
 
-plotly = pytest.importorskip("plotly.graph_objs")
-
-
+@requires("plotly.graph_objs")
 def test_plotly_adapter() -> None:
     example = load_example("plotly_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -20,9 +17,7 @@ def test_plotly_adapter() -> None:
     assert summary == expected_output(example, meta)
 
 
-bokeh_plotting = pytest.importorskip("bokeh.plotting")
-
-
+@requires("bokeh.plotting")
 def test_bokeh_adapter() -> None:
     example = load_example("bokeh_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -33,9 +28,7 @@ def test_bokeh_adapter() -> None:
     assert summary == expected_output(example, meta)
 
 
-seaborn = pytest.importorskip("seaborn")
-
-
+@requires("seaborn")
 def test_seaborn_adapter() -> None:
     example = load_example("seaborn_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -46,9 +39,7 @@ def test_seaborn_adapter() -> None:
     assert summary == expected_output(example, meta)
 
 
-altair = pytest.importorskip("altair")
-
-
+@requires("altair")
 def test_altair_adapter() -> None:
     example = load_example("altair_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -59,9 +50,7 @@ def test_altair_adapter() -> None:
     assert summary == expected_output(example, meta)
 
 
-matplotlib = pytest.importorskip("matplotlib")
-
-
+@requires("matplotlib")
 def test_matplotlib_adapter() -> None:
     example = load_example("matplotlib_adapter")
     meta = dispatch_adapter(build_input(example))
@@ -71,6 +60,7 @@ def test_matplotlib_adapter() -> None:
     assert summary == expected_output(example, meta)
 
 
+@requires("matplotlib")
 def test_matplotlib_axes_inference() -> None:
     example = load_example("matplotlib_axes_inference")
     meta = dispatch_adapter(build_input(example))
@@ -80,9 +70,28 @@ def test_matplotlib_axes_inference() -> None:
     assert summary == expected_output(example, meta)
 
 
+@requires("matplotlib")
 def test_matplotlib_axes_image_hist() -> None:
     example = load_example("matplotlib_axes_image_hist")
     meta = dispatch_adapter(build_input(example))
     summary = deterministic_summary(meta)
     print("mpl_axes_image_hist:", summary)
     assert summary == expected_output(example, meta)
+
+
+@requires("matplotlib")
+def test_matplotlib_reflects_edits_made_between_draws() -> None:
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    ax.set_title("a")
+    assert dispatch_adapter(ax)["visual_elements"]["title"] == "a"
+    fig.canvas.draw()
+
+    ax.set_title("b")
+    ax.plot([1, 2], [3, 4])
+    fig.canvas.draw()
+    meta = dispatch_adapter(ax)
+    assert meta["visual_elements"]["title"] == "b"
+    assert meta["visual_elements"]["num_lines"] == 1
+    plt.close(fig)
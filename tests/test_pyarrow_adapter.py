@@ -1,13 +1,12 @@
 """Tests for PyArrow adapter."""
 
-import pytest
-
 from pretty_little_summary.adapters import dispatch_adapter
 from pretty_little_summary.synthesizer import deterministic_summary
+from tests._helpers import requires
 from tests.input import build_input, expected_output, load_example
 
 
-pa = pytest.importorskip("pyarrow")
+pytestmark = requires("pyarrow")
 
 
 def test_pyarrow_table() -> None:
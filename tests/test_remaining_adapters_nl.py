@@ -2,10 +2,9 @@
 
 import asyncio
 
-import pytest
-
 from pretty_little_summary.adapters import dispatch_adapter
 from pretty_little_summary.synthesizer import deterministic_summary
+from tests._helpers import requires
 from tests.input import build_input, expected_output, load_example
 
 
@@ -51,9 +50,7 @@ def test_traceback_adapter_nl() -> None:
     assert summary == expected_output(example, meta)
 
 
-networkx = pytest.importorskip("networkx")
-
-
+@requires("networkx")
 def test_networkx_adapter_nl() -> None:
     example = load_example("networkx_adapter_nl")
     meta = dispatch_adapter(build_input(example))
@@ -61,9 +58,7 @@ def test_networkx_adapter_nl() -> None:
     assert summary == expected_output(example, meta)
 
 
-requests = pytest.importorskip("requests")
-
-
+@requires("requests")
 def test_requests_adapter_nl() -> None:
     example = load_example("requests_adapter_nl")
     meta = dispatch_adapter(build_input(example))
@@ -71,9 +66,7 @@ def test_requests_adapter_nl() -> None:
     assert summary == expected_output(example, meta)
 
 
-polars = pytest.importorskip("polars")
-
-
+@requires("polars")
 def test_polars_adapter_nl() -> None:
     example = load_example("polars_adapter_nl")
     meta = dispatch_adapter(build_input(example))
@@ -81,9 +74,7 @@ def test_polars_adapter_nl() -> None:
     assert summary == expected_output(example, meta)
 
 
-pydantic = pytest.importorskip("pydantic")
-
-
+@requires("pydantic")
 def test_pydantic_adapter_nl() -> None:
     example = load_example("pydantic_adapter_nl")
     meta = dispatch_adapter(build_input(example))
@@ -91,9 +82,7 @@ def test_pydantic_adapter_nl() -> None:
     assert summary == expected_output(example, meta)
 
 
-torch = pytest.importorskip("torch")
-
-
+@requires("torch")
 def test_pytorch_adapter_nl() -> None:
     example = load_example("pytorch_adapter_nl")
     meta = dispatch_adapter(build_input(example))
@@ -101,9 +90,7 @@ def test_pytorch_adapter_nl() -> None:
     assert summary == expected_output(example, meta)
 
 
-xarray = pytest.importorskip("xarray")
-
-
+@requires("xarray")
 def test_xarray_adapter_nl() -> None:
     example = load_example("xarray_adapter_nl")
     meta = dispatch_adapter(build_input(example))
@@ -1,13 +1,12 @@
 """Tests for scipy sparse adapter."""
 
-import pytest
-
 from pretty_little_summary.adapters import dispatch_adapter
 from pretty_little_summary.synthesizer import deterministic_summary
+from tests._helpers import requires
 from tests.input import build_input, expected_output, load_example
 
 
-sp = pytest.importorskip("scipy.sparse")
+pytestmark = requires("scipy.sparse")
 
 
 def test_scipy_sparse_csr() -> None:
@@ -140,3 +140,21 @@ def test_function_adapter() -> None:
     summary = deterministic_summary(meta)
     print("function:", summary)
     assert summary == expected_output(example, meta)
+
+
+def test_function_signature_matches_inspect() -> None:
+    import inspect
+
+    from pretty_little_summary.adapters.callables import _function_signature
+
+    def plain(a, b, /, c, *args, d, **kwargs):
+        pass
+
+    def keyword_only(a, *, b):
+        pass
+
+    def with_defaults(a, b=1):
+        pass
+
+    for fn in (plain, keyword_only, with_defaults, lambda: None, lambda *a: a):
+        assert _function_signature(fn) == str(inspect.signature(fn))